@@ -8,6 +8,7 @@ block_cipher = None
 
 # All Python files from src/ that need to be included
 hiddenimports = [
+    'commands',
     'config',
     'discovery',
     'remote_entity',
@@ -18,6 +19,7 @@ hiddenimports = [
 a = Analysis(
     [
         'src/driver.py',
+        'src/commands.py',
         'src/config.py',
         'src/discovery.py',
         'src/remote_entity.py',
@@ -0,0 +1,454 @@
+"""
+Command handlers for Sony Audio remote entities.
+
+Parses the simple commands sent to a remote entity and carries them out on the device.
+"""
+
+import asyncio
+import logging
+import re
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import ucapi
+from ucapi import remote
+
+from settings_cache import DeviceSettingsCache
+from sony_client import SonyApiError, SonyAudioDevice, zone_uri
+
+_LOG = logging.getLogger(__name__)
+
+# Per-device data the handlers work with, keyed by entity_id; filled in by the driver on setup
+device_input_maps: dict[str, dict[str, str]] = {}  # input command -> source URI
+device_settings_caches: dict[str, DeviceSettingsCache] = {}
+
+# Updates an entity's state after a power command: (entity_id, state) -> changed; set by the driver
+entity_state_setter: Callable[[str, remote.States], bool] | None = None
+
+# Last mute state set by this driver, keyed by entity_id: (muted, time.monotonic() when set).
+# Only trusted for MUTE_CACHE_TTL seconds since the mute can also change on the device itself.
+device_mute: dict[str, tuple[bool, float]] = {}
+MUTE_CACHE_TTL = 5.0
+
+# Upper bound for the repeat count of a single volume command
+MAX_VOLUME_REPEAT = 50
+
+# A volume press is sent right away; presses arriving while a change is being sent are
+# combined into one change sent next. Per entity_id: the change being sent, and the one waiting
+_volume_sending: dict[str, asyncio.Future] = {}
+_volume_waiting: dict[str, "_VolumeChange"] = {}
+
+# Speaker levels are updated in the settings cache as they are set; the cache is
+# refreshed from the device before adjusting a level once it is older than this (seconds)
+SETTINGS_MAX_AGE = 60.0
+
+# Entities whose device rejected a relative volume change larger than one step
+_single_step_volume: set[str] = set()
+
+# API error code with which a device rejects a relative volume step it does not accept (Illegal Argument)
+VOLUME_STEP_REJECTED_CODE = 3
+
+# Repeats of the same toggle command within this many seconds are ignored
+TOGGLE_DEBOUNCE = 0.25
+_last_toggle: dict[tuple[str, str], float] = {}
+
+
+@dataclass(slots=True)
+class _VolumeChange:
+    """Volume steps of combined presses, and the outcome of sending them."""
+
+    delta: int
+    sent: asyncio.Future
+
+
+@dataclass(slots=True)
+class CommandParams:
+    """Validated parameters of a simple command."""
+
+    command: str
+    repeat: int = 1
+
+    @classmethod
+    def parse(cls, params: dict[str, Any] | None) -> "CommandParams | None":
+        """
+        Validate and normalize SEND_CMD parameters.
+
+        Args:
+            params: Raw command parameters
+
+        Returns:
+            Command parameters with repeat clamped to 1..MAX_VOLUME_REPEAT, or None if invalid
+        """
+        if not params:
+            return None
+        command = params.get("command")
+        if not command or not isinstance(command, str):
+            return None
+        try:
+            repeat = int(params.get("repeat", 1))
+        except (TypeError, ValueError):
+            return None
+        # Command names in the handler tables are interned literals; interning the
+        # incoming name lets the dict lookup match by identity
+        return cls(sys.intern(command), min(max(repeat, 1), MAX_VOLUME_REPEAT))
+
+
+def _get_settings_cache(entity_id: str) -> DeviceSettingsCache | None:
+    """Get the settings cache of a device, logging when it is missing."""
+    settings_cache = device_settings_caches.get(entity_id)
+    if not settings_cache:
+        _LOG.warning("No settings cache found for device %s", entity_id)
+    return settings_cache
+
+
+async def _set_power(device: SonyAudioDevice, entity_id: str, active: bool) -> ucapi.StatusCodes:
+    """Switch the device on or off and update the entity state."""
+    await device.set_power_status("active" if active else "standby")
+    if entity_state_setter is not None:
+        entity_state_setter(entity_id, remote.States.ON if active else remote.States.OFF)
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_power_on(device: SonyAudioDevice, entity: ucapi.Remote, _cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle POWER_ON."""
+    return await _set_power(device, entity.id, True)
+
+
+async def _cmd_power_off(device: SonyAudioDevice, entity: ucapi.Remote, _cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle POWER_OFF."""
+    return await _set_power(device, entity.id, False)
+
+
+def _is_repeated_toggle(entity_id: str, command: str) -> bool:
+    """
+    Check whether a toggle command repeats one sent within TOGGLE_DEBOUNCE.
+
+    Bursts from a held or mashed button would otherwise flip the state back
+    and forth with a round-trip per press.
+    """
+    now = time.monotonic()
+    key = (entity_id, command)
+    if now - _last_toggle.get(key, float("-inf")) < TOGGLE_DEBOUNCE:
+        _LOG.debug("Ignoring repeated %s for %s", command, entity_id)
+        return True
+    _last_toggle[key] = now
+    return False
+
+
+async def _cmd_power_toggle(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle POWER_TOGGLE based on the current entity state."""
+    if _is_repeated_toggle(entity.id, cmd.command):
+        return ucapi.StatusCodes.OK
+    return await _set_power(device, entity.id, entity.attributes.get(remote.Attributes.STATE) == remote.States.OFF)
+
+
+async def _cmd_volume(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle VOLUME_UP and VOLUME_DOWN."""
+    delta = cmd.repeat if cmd.command == "VOLUME_UP" else -cmd.repeat
+
+    # Join the change waiting for the one being sent; all its presses share its outcome
+    waiting = _volume_waiting.get(entity.id)
+    if waiting is not None:
+        waiting.delta += delta
+        await asyncio.shield(waiting.sent)
+        return ucapi.StatusCodes.OK
+
+    change = _VolumeChange(delta, asyncio.get_running_loop().create_future())
+    sending = _volume_sending.get(entity.id)
+    try:
+        if sending is not None:
+            _volume_waiting[entity.id] = change
+            try:
+                await asyncio.wait([sending])
+            finally:
+                del _volume_waiting[entity.id]
+        _volume_sending[entity.id] = change.sent
+        await _change_volume(device, entity.id, change.delta)
+    except BaseException as e:
+        # Fails the presses that joined the change too; a cancelled change is a failure for them
+        change.sent.set_exception(e if isinstance(e, Exception) else RuntimeError("Volume change cancelled"))
+        change.sent.exception()  # retrieved here, as possibly no press joined
+        raise
+    else:
+        change.sent.set_result(None)
+    finally:
+        if _volume_sending.get(entity.id) is change.sent:
+            del _volume_sending[entity.id]
+    return ucapi.StatusCodes.OK
+
+
+async def _change_volume(device: SonyAudioDevice, entity_id: str, delta: int) -> None:
+    """Change the volume by a number of steps, in one request where the device accepts it."""
+    delta = min(max(delta, -MAX_VOLUME_REPEAT), MAX_VOLUME_REPEAT)
+    if not delta:
+        return
+
+    # Send the whole change as one relative step instead of one request per step
+    if abs(delta) > 1 and entity_id not in _single_step_volume:
+        try:
+            await device.set_volume(f"{delta:+d}")
+            return
+        except SonyApiError as e:
+            # Standby, busy and other errors are not about the step size
+            if str(e.code) != str(VOLUME_STEP_REJECTED_CODE):
+                raise
+            # Some models only accept single steps; don't try larger ones on this device again
+            _LOG.debug("Relative volume step of %d rejected, stepping one at a time", delta)
+            _single_step_volume.add(entity_id)
+
+    step = "+1" if delta > 0 else "-1"
+    for _ in range(abs(delta)):
+        await device.set_volume(step)
+
+
+async def _cmd_mute_on(device: SonyAudioDevice, entity: ucapi.Remote, _cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle MUTE_ON."""
+    await device.set_mute(True)
+    device_mute[entity.id] = (True, time.monotonic())
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_mute_off(device: SonyAudioDevice, entity: ucapi.Remote, _cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle MUTE_OFF."""
+    await device.set_mute(False)
+    device_mute[entity.id] = (False, time.monotonic())
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_mute_toggle(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle MUTE_TOGGLE."""
+    if _is_repeated_toggle(entity.id, cmd.command):
+        return ucapi.StatusCodes.OK
+
+    # Use the mute state we last set if it is recent, otherwise ask the device
+    cached = device_mute.get(entity.id)
+    if cached and time.monotonic() - cached[1] < MUTE_CACHE_TTL:
+        muted = cached[0]
+    else:
+        vol_info = await device.get_volume_info()
+        if not vol_info:
+            return ucapi.StatusCodes.OK
+        muted = vol_info[0].get("mute", "off") != "off"
+    await device.set_mute(not muted)
+    device_mute[entity.id] = (not muted, time.monotonic())
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_refresh_settings(
+    _device: SonyAudioDevice, entity: ucapi.Remote, _cmd: CommandParams
+) -> ucapi.StatusCodes:
+    """Handle REFRESH_SETTINGS."""
+    settings_cache = device_settings_caches.get(entity.id)
+    if settings_cache:
+        await settings_cache.refresh()
+        _LOG.info("Settings cache refreshed for device %s", entity.id)
+    return ucapi.StatusCodes.OK
+
+
+# Precompiled parsers for the dynamically generated command names
+_SOUND_CMD_RE = re.compile(r"SOUND_(FIELD|[^_]+)_(.+)")
+_SPEAKER_CMD_RE = re.compile(r"SPEAKER_(.+)_(UP|DOWN)")
+_ZONE_CMD_RE = re.compile(r"ZONE(\d)_(.+)")
+_SYSTEM_CMD_RE = re.compile(r"SYSTEM_(DIMMER|HDMI_OUTPUT)_(.+)")
+
+# Sound setting target of each SYSTEM_<TARGET> command, and HDMI output values that differ from the command
+SYSTEM_TARGETS = {"DIMMER": "dimmer", "HDMI_OUTPUT": "hdmiOutput"}
+HDMI_OUTPUT_VALUES = {"a": "hdmi_A", "b": "hdim_B", "ab": "hdmi_AB", "off": "off"}
+
+
+async def _cmd_sound(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle dynamic sound settings (Sound Field, 360SSM, calibration, etc.)."""
+    settings_cache = _get_settings_cache(entity.id)
+    if not settings_cache:
+        return ucapi.StatusCodes.SERVER_ERROR
+
+    # Parse command: SOUND_<TARGET>_<VALUE> or SOUND_FIELD_<VALUE>
+    match = _SOUND_CMD_RE.fullmatch(cmd.command)
+    if not match:
+        _LOG.warning("Invalid sound command: %s", cmd.command)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    name, value = match.group(1), match.group(2).lower()
+    target = "soundField" if name == "FIELD" else name.lower()
+
+    # Validate setting exists and value is valid
+    if not settings_cache.validate_setting_value(target, value):
+        _LOG.warning("Invalid sound setting: %s = %s", target, value)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    await device.set_sound_setting(target, value)
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_speaker(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle dynamic speaker level adjustments."""
+    settings_cache = _get_settings_cache(entity.id)
+    if not settings_cache:
+        return ucapi.StatusCodes.SERVER_ERROR
+
+    # Parse: SPEAKER_<NAME>_UP or SPEAKER_<NAME>_DOWN
+    match = _SPEAKER_CMD_RE.fullmatch(cmd.command)
+    if not match:
+        return ucapi.StatusCodes.BAD_REQUEST
+    speaker_name, direction = match.groups()
+
+    # Find matching speaker setting in cache
+    control = settings_cache.get_speaker_control(speaker_name)
+    if control is None:
+        _LOG.warning("Unknown speaker control: %s", speaker_name)
+        return ucapi.StatusCodes.BAD_REQUEST
+    target, min_val, max_val, step = control
+
+    # Pick up changes made elsewhere (e.g. on the device itself) if the cache is old
+    await settings_cache.refresh(max_age=SETTINGS_MAX_AGE)
+
+    # Get current value from cache
+    current_value_str = settings_cache.get_current_value(target)
+    if current_value_str is None:
+        _LOG.warning("Could not get current value for %s", target)
+        return ucapi.StatusCodes.SERVER_ERROR
+
+    current_value = float(current_value_str)
+
+    # Calculate new value
+    if direction == "UP":
+        new_value = min(current_value + step, max_val)
+    else:
+        new_value = max(current_value - step, min_val)
+
+    # Set new value
+    await device.set_speaker_level(target, new_value)
+    _LOG.info("Set %s to %.1f dB", target, new_value)
+
+    # Store the new value so the next press doesn't need a full refresh
+    settings_cache.set_cached_value(target, f"{new_value:.1f}")
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_zone(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle dynamic multi-zone controls."""
+    settings_cache = _get_settings_cache(entity.id)
+    if not settings_cache:
+        return ucapi.StatusCodes.SERVER_ERROR
+
+    # Extract zone number from ZONE<N>_<CMD>
+    match = _ZONE_CMD_RE.fullmatch(cmd.command)
+    if not match:
+        _LOG.warning("Invalid zone command format: %s", cmd.command)
+        return ucapi.StatusCodes.BAD_REQUEST
+    zone, cmd_type = int(match.group(1)), match.group(2)
+
+    # Validate zone exists on this device
+    if zone not in settings_cache.zones:
+        _LOG.warning("Zone %d not available on this device", zone)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    # Handle zone commands
+    if cmd_type == "VOLUME_UP":
+        await device.set_zone_volume(zone, "+1")
+    elif cmd_type == "VOLUME_DOWN":
+        await device.set_zone_volume(zone, "-1")
+    elif cmd_type == "MUTE_TOGGLE":
+        vol_info = await device.get_zone_volume(zone)
+        current_mute = vol_info.get("mute", "off")
+        await device.set_zone_mute(zone, current_mute == "off")
+    elif cmd_type == "ACTIVATE":
+        await device.set_active_terminal(zone_uri(zone), True)
+    elif cmd_type == "DEACTIVATE":
+        await device.set_active_terminal(zone_uri(zone), False)
+    else:
+        _LOG.warning("Unknown zone command type: %s", cmd_type)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_system(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle dynamic system controls (dimmer, HDMI output), which are sound settings."""
+    settings_cache = _get_settings_cache(entity.id)
+    if not settings_cache:
+        return ucapi.StatusCodes.SERVER_ERROR
+
+    # Parse SYSTEM_<TARGET>_<VALUE>
+    match = _SYSTEM_CMD_RE.fullmatch(cmd.command)
+    if not match:
+        _LOG.warning("Unknown system command: %s", cmd.command)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    target, value = SYSTEM_TARGETS[match.group(1)], match.group(2).lower()
+    if target == "hdmiOutput":
+        # Handle special case mappings for HDMI output
+        value = HDMI_OUTPUT_VALUES.get(value, value)
+
+    # Validate and set
+    if settings_cache.validate_setting_value(target, value):
+        await device.set_sound_setting(target, value)
+    else:
+        _LOG.warning("Invalid system setting: %s = %s", target, value)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    return ucapi.StatusCodes.OK
+
+
+async def _cmd_input(device: SonyAudioDevice, entity: ucapi.Remote, cmd: CommandParams) -> ucapi.StatusCodes:
+    """Handle input switching."""
+    uri = device_input_maps.get(entity.id, {}).get(cmd.command)
+    if not uri:
+        _LOG.warning("Unknown input command: %s", cmd.command)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    await device.switch_input(uri)
+    return ucapi.StatusCodes.OK
+
+
+# Signature shared by all command handlers: (device, entity, command parameters) -> status
+CommandHandler = Callable[[SonyAudioDevice, ucapi.Remote, CommandParams], Awaitable[ucapi.StatusCodes]]
+
+# Handlers for fixed command names
+COMMAND_HANDLERS: dict[str, CommandHandler] = {
+    "POWER_ON": _cmd_power_on,
+    "POWER_OFF": _cmd_power_off,
+    "POWER_TOGGLE": _cmd_power_toggle,
+    "VOLUME_UP": _cmd_volume,
+    "VOLUME_DOWN": _cmd_volume,
+    "MUTE_ON": _cmd_mute_on,
+    "MUTE_OFF": _cmd_mute_off,
+    "MUTE_TOGGLE": _cmd_mute_toggle,
+    "REFRESH_SETTINGS": _cmd_refresh_settings,
+}
+
+# Handlers for dynamically generated commands, by the command's first word without
+# a trailing number (ZONE2_VOLUME_UP -> ZONE)
+PREFIX_HANDLERS: dict[str, CommandHandler] = {
+    "INPUT": _cmd_input,
+    "SOUND": _cmd_sound,
+    "SPEAKER": _cmd_speaker,
+    "ZONE": _cmd_zone,
+    "SYSTEM": _cmd_system,
+}
+
+# Entity commands that map onto simple commands
+ENTITY_COMMANDS = {
+    remote.Commands.ON: "POWER_ON",
+    remote.Commands.OFF: "POWER_OFF",
+    remote.Commands.TOGGLE: "POWER_TOGGLE",
+}
+
+
+def find_handler(command: str) -> CommandHandler | None:
+    """
+    Find the handler of a simple command.
+
+    Args:
+        command: Command name (e.g., "POWER_ON", "ZONE2_VOLUME_UP")
+
+    Returns:
+        Handler of the command, or None if the command is unknown
+    """
+    handler = COMMAND_HANDLERS.get(command)
+    if handler is None:
+        handler = PREFIX_HANDLERS.get(command.partition("_")[0].rstrip("0123456789"))
+    return handler
@@ -4,24 +4,36 @@ Configuration management for Sony Audio integration.
 Handles loading and saving device configurations.
 """
 
+import functools
 import json
 import logging
 import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 _LOG = logging.getLogger(__name__)
 
 # Configuration file name
 CONFIG_FILE = "sony_audio_config.json"
 
+# Last loaded/saved configuration: (path, st_mtime_ns, st_size, config)
+_CONFIG_CACHE: tuple[Path, int, int, dict[str, Any]] | None = None
+
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """
     Get configuration directory path.
 
     Uses UC_CONFIG_HOME environment variable if set, otherwise defaults to
-    current directory or home directory.
+    current directory or home directory. The result is resolved once per process.
 
     Returns:
         Path to configuration directory
@@ -37,6 +49,7 @@ def get_config_dir() -> Path:
     return Path.cwd()
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """
     Get full path to configuration file.
@@ -44,27 +57,74 @@ def get_config_path() -> Path:
     Returns:
         Path to configuration file
     """
+    return get_config_dir() / CONFIG_FILE
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_config_dir() -> Path:
+    """
+    Create the configuration directory on first use.
+
+    Returns:
+        Path to configuration directory
+    """
     config_dir = get_config_dir()
     config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / CONFIG_FILE
+    return config_dir
+
+
+def _update_cache(config_path: Path, config: dict[str, Any]) -> None:
+    """
+    Remember a configuration together with the file's current stat signature.
+
+    Args:
+        config_path: Path to configuration file
+        config: Configuration dictionary matching the file contents
+    """
+    global _CONFIG_CACHE  # pylint: disable=global-statement
+
+    try:
+        stat = config_path.stat()
+    except OSError:
+        _CONFIG_CACHE = None
+        return
+
+    _CONFIG_CACHE = (config_path, stat.st_mtime_ns, stat.st_size, config)
 
 
 def load_config() -> dict[str, Any]:
     """
     Load configuration from file.
 
+    The parsed configuration is cached and only re-read when the file's
+    modification time or size changes. Callers must not mutate the returned
+    dictionary unless they pass it to save_config() afterwards.
+
     Returns:
         Configuration dictionary, empty dict if file doesn't exist
     """
+    global _CONFIG_CACHE  # pylint: disable=global-statement
+
     config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         _LOG.info("No configuration file found at %s", config_path)
+        _CONFIG_CACHE = None
+        return {}
+    except OSError as e:
+        _LOG.error("Error loading configuration: %s", e)
         return {}
 
+    cache = _CONFIG_CACHE
+    if cache is not None and cache[0] == config_path and cache[1] == stat.st_mtime_ns and cache[2] == stat.st_size:
+        return cache[3]
+
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             config = json.load(f)
+        _CONFIG_CACHE = (config_path, stat.st_mtime_ns, stat.st_size, config)
         _LOG.info("Loaded configuration from %s", config_path)
         return config
     except Exception as e:
@@ -72,6 +132,36 @@ def load_config() -> dict[str, Any]:
         return {}
 
 
+def reload_config() -> dict[str, Any]:
+    """
+    Discard the cached configuration and load it again from file.
+
+    Returns:
+        Configuration dictionary, empty dict if file doesn't exist
+    """
+    global _CONFIG_CACHE  # pylint: disable=global-statement
+
+    _CONFIG_CACHE = None
+    return load_config()
+
+
+def _encode_config(config: dict[str, Any]) -> bytes:
+    """
+    Serialize configuration to indented JSON bytes.
+
+    Uses orjson when installed, stdlib json otherwise.
+
+    Args:
+        config: Configuration dictionary to serialize
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
+
 def save_config(config: dict[str, Any]) -> bool:
     """
     Save configuration to file.
@@ -83,14 +173,28 @@ def save_config(config: dict[str, Any]) -> bool:
         True if successful, False otherwise
     """
     config_path = get_config_path()
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
 
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        _ensure_config_dir()
+        data = _encode_config(config)
+
+        # Write to a temporary file and swap it in so a crash never leaves a truncated config
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+        _update_cache(config_path, config)
         _LOG.info("Saved configuration to %s", config_path)
         return True
     except Exception as e:
         _LOG.error("Error saving configuration: %s", e)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        reload_config()
         return False
 
 
@@ -102,11 +206,52 @@ def get_device_config(device_id: str) -> dict[str, Any] | None:
         device_id: Device identifier (usually IP address or serial number)
 
     Returns:
-        Device configuration dictionary or None if not found
+        Device configuration dictionary or None if not found. The dictionary
+        is shared with the configuration cache and must be treated as read-only.
+    """
+    return load_config().get("devices", {}).get(device_id)
+
+
+@contextmanager
+def mutating_config() -> Iterator[dict[str, Any]]:
+    """
+    Load the configuration for a series of modifications and save it once.
+
+    The configuration is written when the block exits normally. If the block
+    raises, the in-memory changes are discarded and nothing is written.
+
+    Yields:
+        Configuration dictionary to modify in place
     """
     config = load_config()
-    devices = config.get("devices", {})
-    return devices.get(device_id)
+    try:
+        yield config
+    except BaseException:
+        reload_config()
+        raise
+    save_config(config)
+
+
+def save_device_configs(updates: dict[str, dict[str, Any]]) -> bool:
+    """
+    Save configuration for several devices with a single write.
+
+    The cached configuration is not modified; an updated copy is saved and
+    replaces it, so callers on other threads never see a half-applied update.
+
+    Args:
+        updates: Dictionary of device_id -> device_config
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not updates:
+        return True
+
+    config = dict(load_config())
+    config["devices"] = {**config.get("devices", {}), **updates}
+
+    return save_config(config)
 
 
 def save_device_config(device_id: str, device_config: dict[str, Any]) -> bool:
@@ -120,13 +265,30 @@ def save_device_config(device_id: str, device_config: dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    config = load_config()
+    return save_device_configs({device_id: device_config})
+
 
-    if "devices" not in config:
-        config["devices"] = {}
+def remove_device_configs(device_ids: Iterable[str]) -> bool:
+    """
+    Remove configuration for several devices with a single write.
+
+    Like save_device_configs(), saves an updated copy instead of modifying
+    the cached configuration.
 
-    config["devices"][device_id] = device_config
+    Args:
+        device_ids: Device identifiers
 
+    Returns:
+        True if successful, False otherwise
+    """
+    config = load_config()
+    devices = config.get("devices", {})
+    removing = {device_id for device_id in device_ids if device_id in devices}
+    if not removing:
+        return True
+
+    config = dict(config)
+    config["devices"] = {device_id: device for device_id, device in devices.items() if device_id not in removing}
     return save_config(config)
 
 
@@ -140,13 +302,7 @@ def remove_device_config(device_id: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    config = load_config()
-
-    if "devices" in config and device_id in config["devices"]:
-        del config["devices"][device_id]
-        return save_config(config)
-
-    return True
+    return remove_device_configs((device_id,))
 
 
 def get_all_devices() -> dict[str, dict[str, Any]]:
@@ -154,7 +310,7 @@ def get_all_devices() -> dict[str, dict[str, Any]]:
     Get all configured devices.
 
     Returns:
-        Dictionary of device_id -> device_config
+        Dictionary of device_id -> device_config; a shallow copy of the cached
+        configuration, so the caller may modify it
     """
-    config = load_config()
-    return config.get("devices", {})
+    return dict(load_config().get("devices", {}))
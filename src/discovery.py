@@ -6,18 +6,29 @@ Discovers Sony Audio Control API compatible devices on the local network.
 
 import asyncio
 import logging
+import re
 import socket
 import xml.etree.ElementTree as ET
 from typing import Any
 
 import aiohttp
 
+try:
+    from defusedxml.ElementTree import DefusedXMLParser as _XMLParser
+except ImportError:  # pragma: no cover - stdlib expat already refuses external entities
+    _XMLParser = ET.XMLParser
+
+from sony_client import SonyAudioDevice, get_shared_session
+
 _LOG = logging.getLogger(__name__)
 
 # SSDP discovery constants
 SSDP_ADDR = "239.255.255.250"
 SSDP_PORT = 1900
-SSDP_MX = 3  # Max wait time for responses
+SSDP_MX = 1  # Max wait time for responses; devices spread their replies over up to this many seconds
+SSDP_MX_SLACK = 0.3  # Network round trip on top of SSDP_MX before every device can have answered
+SSDP_RCVBUF_SIZE = 1 << 20  # Room for bursts of responses from busy networks
+SSDP_TTL = 2  # UDA recommends a small multicast TTL for M-SEARCH
 
 # Service types to search for
 # Some Sony devices (like TA-AN1000) only respond to MediaRenderer
@@ -26,13 +37,180 @@ SSDP_SERVICE_TYPES = [
     "urn:schemas-upnp-org:device:MediaRenderer:1",  # Media Renderer (soundbars)
 ]
 
+# Search target only answered by Sony Audio Control API devices
+SSDP_SONY_SERVICE_TYPE = SSDP_SERVICE_TYPES[0].encode("utf-8")
+SSDP_MEDIA_RENDERER_TYPE = SSDP_SERVICE_TYPES[1].encode("utf-8")
+
+# Model name fragments of Sony audio product lines (receivers, amplifiers, soundbars, speakers)
+SONY_MODEL_PREFIXES = ("TA-", "STR-", "HT-", "SRS-")
+
+# JSON-RPC request used to probe the default Sony API endpoint
+_PROBE_PAYLOAD = {"method": "getInterfaceInformation", "id": 1, "params": [], "version": "1.0"}
+
+# "Name: value" header lines of an SSDP response
+_HEADER_RE = re.compile(rb"^([A-Za-z0-9-]+)[ \t]*:[ \t]*(.*?)[ \t]*\r?$", re.MULTILINE)
+
+# Headers that identify Sony devices, matched case-insensitively on raw bytes
+_SONY_HINT_HEADERS = (b"server", b"location", b"x-av-server-info")
+_SONY_RE = re.compile(rb"sony", re.IGNORECASE)
+
+# Descriptor elements we care about, by local name (namespace prefix stripped)
+_DEVICE_FIELDS = {
+    "friendlyName": "friendly_name",
+    "modelName": "model_name",
+    "manufacturer": "manufacturer",
+}
+_DEVICE_INFO_TAG = "X_ScalarWebAPI_DeviceInfo"
+_SERVICE_LIST_TAG = "X_ScalarWebAPI_ServiceList"
+_BASE_URL_TAG = "X_ScalarWebAPI_BaseURL"
+_CONTAINER_TAGS = frozenset((_DEVICE_INFO_TAG, _SERVICE_LIST_TAG))
+
+# Upper bound for a device descriptor body; real descriptors are a few KiB
+MAX_DESCRIPTOR_SIZE = 64 * 1024
+
+# Parsed descriptors by location: (ETag, Last-Modified, device info)
+_DESCRIPTOR_CACHE: dict[str, tuple[str | None, str | None, dict[str, Any]]] = {}
+
+# Host part of an API base URL such as "http://192.168.1.201:10000/sony"
+_BASEURL_IP_RE = re.compile(r"//([^:/]+)")
+
+
+class _SSDPProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that queues every received SSDP response."""
+
+    def __init__(self, queue: asyncio.Queue):
+        """
+        Initialize SSDP protocol.
+
+        Args:
+            queue: Queue receiving (data, addr) tuples
+        """
+        self._queue = queue
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Queue a received datagram."""
+        self._queue.put_nowait((data, addr))
+
+    def error_received(self, exc: Exception) -> None:
+        """Log socket errors without aborting discovery."""
+        _LOG.debug("Error receiving SSDP response: %s", exc)
+
+
+def _create_ssdp_socket() -> socket.socket:
+    """Create the non-blocking UDP socket used for M-SEARCH requests and responses."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        # Many devices answer within the same few milliseconds; a larger receive
+        # buffer keeps the kernel from dropping responses before we drain them
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SSDP_RCVBUF_SIZE)
+    except OSError as e:
+        _LOG.debug("Could not enlarge SSDP receive buffer: %s", e)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, SSDP_TTL)
+    sock.bind(("0.0.0.0", 0))
+    sock.setblocking(False)
+    return sock
+
+
+def _multicast_interfaces() -> list[str]:
+    """
+    Get the local IPv4 addresses to send M-SEARCH requests from.
+
+    On multi-homed hosts (VPN, docker bridges) the default multicast route can
+    point away from the LAN the devices are on, so every interface is searched.
+
+    Returns:
+        Sorted list of non-loopback interface addresses (may be empty)
+    """
+    addresses = set()
+    try:
+        for *_, sockaddr in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+            addresses.add(sockaddr[0])
+    except OSError as e:
+        _LOG.debug("Could not resolve host addresses: %s", e)
+
+    # Address of the interface the routing table picks for SSDP traffic
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.connect((SSDP_ADDR, SSDP_PORT))
+            addresses.add(probe.getsockname()[0])
+    except OSError as e:
+        _LOG.debug("Could not determine default multicast interface: %s", e)
+
+    return sorted(addr for addr in addresses if not addr.startswith("127.") and addr != "0.0.0.0")
+
+
+def _build_msearch(service_type: str) -> bytes:
+    """
+    Build an SSDP M-SEARCH request for a service type.
+
+    Args:
+        service_type: Search target (ST header value)
+
+    Returns:
+        Encoded M-SEARCH message
+    """
+    return (
+        "M-SEARCH * HTTP/1.1\r\n"
+        f"HOST: {SSDP_ADDR}:{SSDP_PORT}\r\n"
+        'MAN: "ssdp:discover"\r\n'
+        f"MX: {SSDP_MX}\r\n"
+        f"ST: {service_type}\r\n"
+        "\r\n"
+    ).encode("utf-8")
+
+
+def _parse_ssdp_headers(data: bytes) -> dict[bytes, bytes]:
+    """
+    Parse the headers of a raw SSDP response.
+
+    Args:
+        data: Raw datagram payload
+
+    Returns:
+        Dictionary of lower-cased header name -> raw value
+    """
+    return {m.group(1).lower(): m.group(2) for m in _HEADER_RE.finditer(data)}
+
 
-async def discover_sony_devices(timeout: int = 5) -> list[dict[str, Any]]:
+def _is_likely_sony(headers: dict[bytes, bytes]) -> bool:
+    """
+    Check whether an SSDP response is likely to come from a Sony device.
+
+    A response qualifies if it answers the Sony ScalarWebAPI search or if a
+    header mentions Sony (SERVER, LOCATION or Sony's X-AV-Server-Info, which
+    carries cn="Sony Corporation" on MediaRenderer responses).
+
+    Args:
+        headers: Parsed headers from _parse_ssdp_headers()
+
+    Returns:
+        True if the device descriptor is worth fetching
+    """
+    if headers.get(b"st") == SSDP_SONY_SERVICE_TYPE:
+        return True
+    for name in _SONY_HINT_HEADERS:
+        value = headers.get(name)
+        if value and _SONY_RE.search(value):
+            return True
+    return False
+
+
+async def discover_sony_devices(
+    timeout: float = 5, stable_window: float = 0.8, min_wait: float = 1.0
+) -> list[dict[str, Any]]:
     """
     Discover Sony Audio Control API devices on the network via SSDP.
 
+    All service types are searched at once from a single UDP endpoint and
+    device descriptors are fetched while further responses are collected.
+    Once a device has been found, the search ends early when no new device
+    answers for stable_window seconds (but not before min_wait seconds, and
+    never before every device can have answered within the M-SEARCH's MX).
+
     Args:
         timeout: Discovery timeout in seconds
+        stable_window: Seconds without a new device after which the search ends
+        min_wait: Minimum search time in seconds before ending early
 
     Returns:
         List of discovered devices with metadata:
@@ -45,152 +223,340 @@ async def discover_sony_devices(timeout: int = 5) -> list[dict[str, Any]]:
         }, ...]
     """
     devices = []
-    found_locations = set()
+    found_locations: set[bytes] = set()
+    fetch_tasks: list[asyncio.Task] = []
+
+    # Descriptor fetches and API probes use the driver-wide session, so a connection opened
+    # to a device's API here is reused when the device is verified and set up
+    session = get_shared_session()
 
     try:
         _LOG.info("Starting SSDP discovery for Sony devices...")
 
-        # Search for each service type
-        for service_type in SSDP_SERVICE_TYPES:
-            _LOG.debug("Searching for service type: %s", service_type)
-
-            # Create M-SEARCH message for this service type
-            msearch_msg = (
-                "M-SEARCH * HTTP/1.1\r\n"
-                f"HOST: {SSDP_ADDR}:{SSDP_PORT}\r\n"
-                'MAN: "ssdp:discover"\r\n'
-                f"MX: {SSDP_MX}\r\n"
-                f"ST: {service_type}\r\n"
-                "\r\n"
-            ).encode("utf-8")
-
-            # Create UDP socket for SSDP
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            sock.settimeout(timeout / len(SSDP_SERVICE_TYPES))  # Split timeout across service types
-
-            try:
-                # Send M-SEARCH request
-                sock.sendto(msearch_msg, (SSDP_ADDR, SSDP_PORT))
-
-                # Collect responses
-                start_time = asyncio.get_event_loop().time()
-                search_timeout = timeout / len(SSDP_SERVICE_TYPES)
-                while (asyncio.get_event_loop().time() - start_time) < search_timeout:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        sock = _create_ssdp_socket()
+        try:
+            transport, _ = await loop.create_datagram_endpoint(lambda: _SSDPProtocol(queue), sock=sock)
+        except Exception:
+            sock.close()
+            raise
+
+        try:
+            # Send M-SEARCH requests for all service types back-to-back on every interface;
+            # without a usable interface address the kernel's default route is used.
+            # Host name resolution can take seconds, so it runs off the event loop
+            interfaces = await asyncio.to_thread(_multicast_interfaces)
+            for interface in interfaces or [None]:
+                if interface:
                     try:
-                        data, addr = sock.recvfrom(4096)
-                        response = data.decode("utf-8", errors="ignore")
-
-                        # Parse SSDP response
-                        location = None
-                        st = None
-                        server = None
-                        for line in response.split("\r\n"):
-                            line_lower = line.lower()
-                            if line_lower.startswith("location:"):
-                                location = line.split(":", 1)[1].strip()
-                            elif line_lower.startswith("st:"):
-                                st = line.split(":", 1)[1].strip()
-                            elif line_lower.startswith("server:"):
-                                server = line.split(":", 1)[1].strip()
-
-                        # Check if this is a Sony device and we haven't seen it yet
-                        # Accept if it matches our service type OR if it's clearly a Sony device
-                        is_sony = (
-                            (st and st in SSDP_SERVICE_TYPES)
-                            or (server and "sony" in server.lower())
-                            or (location and "sony" in location.lower())
-                        )
+                        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface))
+                    except OSError as e:
+                        _LOG.debug("Cannot search on interface %s: %s", interface, e)
+                        continue
+                for service_type in SSDP_SERVICE_TYPES:
+                    _LOG.debug("Searching for service type: %s (interface %s)", service_type, interface or "default")
+                    transport.sendto(_build_msearch(service_type), (SSDP_ADDR, SSDP_PORT))
+
+            # Collect responses until the timeout, or until no new device has answered for a while
+            min_wait = max(min_wait, SSDP_MX + SSDP_MX_SLACK)
+            started = loop.time()
+            deadline = started + timeout
+            last_found = started
+            while True:
+                wait_until = deadline
+                if found_locations:
+                    wait_until = min(deadline, max(started + min_wait, last_found + stable_window))
+                if (remaining := wait_until - loop.time()) <= 0:
+                    break
+                try:
+                    batch = [await asyncio.wait_for(queue.get(), remaining)]
+                except asyncio.TimeoutError:
+                    break
+
+                # Drain everything that arrived meanwhile without yielding between items
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                for data, addr in batch:
+                    try:
+                        # Parse SSDP response; values stay bytes until a device is accepted
+                        headers = _parse_ssdp_headers(data)
+                        raw_location = headers.get(b"location")
+
+                        if not raw_location or raw_location in found_locations:
+                            continue
 
-                        if location and is_sony and location not in found_locations:
-                            found_locations.add(location)
-                            _LOG.info("Found potential Sony device at %s (from %s)", location, addr[0])
+                        # Skip the descriptor download for responses that carry no Sony hint
+                        # (e.g. other vendors' media renderers answering the generic search)
+                        if not _is_likely_sony(headers):
+                            _LOG.debug("Ignoring non-Sony SSDP response from %s", addr[0])
+                            continue
 
-                            # Fetch and parse device descriptor
-                            device_info = await _fetch_device_info(location, addr[0])
-                            if device_info:
-                                devices.append(device_info)
+                        found_locations.add(raw_location)
+                        last_found = loop.time()
+
+                        location = raw_location.decode("utf-8", errors="ignore")
+                        _LOG.info("Found potential Sony device at %s (from %s)", location, addr[0])
+
+                        # Identify the device without blocking the receive loop
+                        is_media_renderer = headers.get(b"st") == SSDP_MEDIA_RENDERER_TYPE
+                        fetch_tasks.append(
+                            asyncio.create_task(_identify_device(session, location, addr[0], is_media_renderer))
+                        )
 
-                    except socket.timeout:
-                        break
                     except Exception as e:
-                        _LOG.debug("Error receiving SSDP response: %s", e)
+                        _LOG.debug("Error parsing SSDP response: %s", e)
+
+        finally:
+            transport.close()
 
-            finally:
-                sock.close()
+        # Descriptor fetches run concurrently; one failing fetch must not discard the others
+        for device_info in await asyncio.gather(*fetch_tasks, return_exceptions=True):
+            if isinstance(device_info, BaseException):
+                _LOG.debug("Descriptor fetch failed: %s", device_info)
+            elif device_info:
+                devices.append(device_info)
 
     except Exception as e:
         _LOG.error("SSDP discovery error: %s", e)
+        for task in fetch_tasks:
+            task.cancel()
 
     _LOG.info("Discovery complete, found %d device(s)", len(devices))
     return devices
 
 
-async def _fetch_device_info(location: str, known_ip: str | None = None) -> dict[str, Any] | None:
+async def _identify_device(
+    session: aiohttp.ClientSession, location: str, ip_address: str, is_media_renderer: bool
+) -> dict[str, Any] | None:
     """
-    Fetch and parse device descriptor XML.
+    Identify a Sony device that answered an SSDP search.
+
+    MediaRenderer descriptors usually carry no ScalarWebAPI information, so
+    for those the default API endpoint is probed first and the descriptor is
+    only fetched if the probe fails.
 
     Args:
+        session: Shared HTTP session
         location: URL to device descriptor XML
-        known_ip: Known IP address from SSDP response (fallback)
+        ip_address: IP address the SSDP response came from
+        is_media_renderer: True if the response answered the MediaRenderer search
 
     Returns:
-        Device info dictionary or None if parsing fails
+        Device info dictionary or None if the device is not usable
+    """
+    if is_media_renderer:
+        device_info = await _probe_sony_api(session, location, ip_address)
+        if device_info:
+            return device_info
+
+    return await _fetch_device_info(session, location, ip_address)
+
+
+async def _probe_sony_api(session: aiohttp.ClientSession, location: str, ip_address: str) -> dict[str, Any] | None:
+    """
+    Probe the default Sony Audio Control API endpoint of a device.
+
+    Args:
+        session: Shared HTTP session
+        location: URL to device descriptor XML (reported in the result)
+        ip_address: Device IP address
+
+    Returns:
+        Device info dictionary or None if the endpoint does not answer
     """
+    base_url = f"http://{ip_address}:10000/sony"
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(location, timeout=aiohttp.ClientTimeout(total=3)) as response:
-                xml_data = await response.text()
+        async with session.post(
+            f"{base_url}/system", json=_PROBE_PAYLOAD, timeout=aiohttp.ClientTimeout(total=1)
+        ) as response:
+            data = await response.json(content_type=None)
 
-        # Parse XML to extract device information
-        root = ET.fromstring(xml_data)
+        info = data["result"][0]
+        model_name = info.get("modelName", "")
+    except Exception as e:
+        _LOG.debug("Sony API probe at %s failed: %s", ip_address, e)
+        return None
 
-        # Define namespaces
-        namespaces = {
-            "": "urn:schemas-upnp-org:device-1-0",
-            "av": "urn:schemas-sony-com:av",
-        }
+    device_info = {
+        "name": info.get("productName") or model_name or "Sony Device",
+        "model": model_name or "Unknown",
+        "manufacturer": "Sony",
+        "ip": ip_address,
+        "base_url": base_url,
+        "location": location,
+    }
+
+    _LOG.debug("Identified device via Sony API probe: %s", device_info)
+    return device_info
+
+
+class _DescriptorTarget:
+    """
+    XML parser target that extracts the fields we need from a UPnP device descriptor.
+
+    No element tree is built; elements are matched by local name as the parser
+    reports them, so the descriptor can be fed in chunks while it downloads.
+    """
+
+    def __init__(self):
+        """Initialize an empty result."""
+        self.info = {"friendly_name": "", "model_name": "", "manufacturer": "", "base_url": ""}
+        self.found_device = False
+        self._service_list_url = ""
+        self._device_depth = 0
+        self._container: str | None = None
+        self._text: list[str] = []
+
+    @property
+    def done(self) -> bool:
+        """Whether the names and the X_ScalarWebAPI_DeviceInfo base URL are all known."""
+        return all(self.info.values())
+
+    def start(self, tag: str, _attrib: dict[str, str]) -> None:
+        """Handle an opening tag."""
+        tag = tag.rpartition("}")[2]
+        if tag == "device":
+            self.found_device = True
+            self._device_depth += 1
+        elif tag in _CONTAINER_TAGS:
+            self._container = tag
+        self._text.clear()
+
+    def data(self, data: str) -> None:
+        """Collect character data of the current element."""
+        self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        tag = tag.rpartition("}")[2]
+        text = "".join(self._text)
+        self._text.clear()
+
+        if tag == "device":
+            self._device_depth -= 1
+        elif tag in _DEVICE_FIELDS:
+            # Only the root device's fields, not those of embedded devices
+            key = _DEVICE_FIELDS[tag]
+            if self._device_depth == 1 and not self.info[key]:
+                self.info[key] = text
+        elif tag == _BASE_URL_TAG and text:
+            # X_ScalarWebAPI_DeviceInfo (TA-AN1000 and newer devices) wins over
+            # the old X_ScalarWebAPI_ServiceList format (older receivers)
+            if self._container == _DEVICE_INFO_TAG and not self.info["base_url"]:
+                self.info["base_url"] = text
+                _LOG.debug("Found base URL in X_ScalarWebAPI_DeviceInfo: %s", text)
+            elif self._container == _SERVICE_LIST_TAG and not self._service_list_url:
+                self._service_list_url = text
+                _LOG.debug("Found base URL in X_ScalarWebAPI_ServiceList: %s", text)
+        elif tag in _CONTAINER_TAGS:
+            self._container = None
+
+    def close(self) -> dict[str, str] | None:
+        """
+        Finish parsing.
+
+        Returns:
+            Dict with friendly_name, model_name, manufacturer and base_url
+            (empty strings when missing), or None if there is no device element
+        """
+        if not self.found_device:
+            return None
+        if not self.info["base_url"]:
+            self.info["base_url"] = self._service_list_url
+        return self.info
 
-        # Extract device info
-        device = root.find(".//device", namespaces)
-        if device is None:
+
+async def _read_descriptor(response: aiohttp.ClientResponse, limit: int) -> dict[str, str] | None:
+    """
+    Parse a device descriptor while it is being downloaded.
+
+    Chunks are fed to the XML parser as they arrive and reading stops as soon
+    as all needed fields are known, so the rest of the body is never fetched.
+
+    Args:
+        response: HTTP response carrying the descriptor
+        limit: Maximum body size in bytes
+
+    Returns:
+        Extracted fields as returned by _DescriptorTarget.close()
+
+    Raises:
+        ValueError: If the body exceeds the limit
+        ET.ParseError: If the descriptor is not well-formed XML
+    """
+    if response.content_length is not None and response.content_length > limit:
+        raise ValueError(f"Response body too large ({response.content_length} bytes)")
+
+    target = _DescriptorTarget()
+    parser = _XMLParser(target=target)
+    size = 0
+    async for chunk in response.content.iter_chunked(4096):
+        size += len(chunk)
+        if size > limit:
+            raise ValueError(f"Response body exceeds {limit} bytes")
+        parser.feed(chunk)
+        if target.done:
+            return target.close()
+
+    return parser.close()
+
+
+async def _fetch_device_info(
+    session: aiohttp.ClientSession, location: str, known_ip: str | None = None
+) -> dict[str, Any] | None:
+    """
+    Fetch and parse device descriptor XML.
+
+    Args:
+        session: Shared HTTP session
+        location: URL to device descriptor XML
+        known_ip: Known IP address from SSDP response (fallback)
+
+    Returns:
+        Device info dictionary or None if parsing fails
+    """
+    try:
+        # Revalidate a previously parsed descriptor instead of downloading it again
+        cached = _DESCRIPTOR_CACHE.get(location)
+        request_headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+        async with session.get(location, headers=request_headers, timeout=aiohttp.ClientTimeout(total=3)) as response:
+            if response.status == 304 and cached:
+                _LOG.debug("Descriptor at %s not modified, using cached device info", location)
+                return dict(cached[2])
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            # Parse XML to extract device information
+            parsed = await _read_descriptor(response, MAX_DESCRIPTOR_SIZE)
+
+        if parsed is None:
             _LOG.warning("No device element found in descriptor")
             return None
 
-        friendly_name = device.findtext("friendlyName", "", namespaces)
-        model_name = device.findtext("modelName", "", namespaces)
-        manufacturer = device.findtext("manufacturer", "", namespaces)
+        friendly_name = parsed["friendly_name"]
+        model_name = parsed["model_name"]
+        manufacturer = parsed["manufacturer"]
 
         # Check if this is actually a Sony device
         is_sony_device = (manufacturer and "sony" in manufacturer.lower()) or (
-            model_name and any(sony_model in model_name.upper() for sony_model in ["TA-", "STR-", "HT-", "SRS-"])
+            model_name and any(sony_model in model_name.upper() for sony_model in SONY_MODEL_PREFIXES)
         )
 
         if not is_sony_device:
             _LOG.debug("Device doesn't appear to be a Sony audio device: %s", model_name)
             return None
 
-        # Extract Sony-specific API base URL
-        base_url = None
-
-        # First try X_ScalarWebAPI_DeviceInfo (TA-AN1000 and newer devices)
-        device_info = device.find(".//av:X_ScalarWebAPI_DeviceInfo", namespaces)
-        if device_info is not None:
-            base_url_elem = device_info.find(".//av:X_ScalarWebAPI_BaseURL", namespaces)
-            if base_url_elem is not None and base_url_elem.text:
-                base_url = base_url_elem.text
-                _LOG.debug("Found base URL in X_ScalarWebAPI_DeviceInfo: %s", base_url)
-
-        # Fallback: try old X_ScalarWebAPI_ServiceList format (older receivers)
-        if not base_url:
-            service_list = device.find(".//av:X_ScalarWebAPI_ServiceList", namespaces)
-            if service_list is not None:
-                for service in service_list.findall(".//av:X_ScalarWebAPI_Service", namespaces):
-                    base_url_elem = service.find(".//av:X_ScalarWebAPI_BaseURL", namespaces)
-                    if base_url_elem is not None and base_url_elem.text:
-                        base_url = base_url_elem.text
-                        _LOG.debug("Found base URL in X_ScalarWebAPI_ServiceList: %s", base_url)
-                        break
+        # Sony-specific API base URL
+        base_url = parsed["base_url"]
 
         # If no base URL in descriptor, try to construct it from known IP
         # (common for MediaRenderer descriptors which don't include ScalarWebAPI info)
@@ -203,9 +569,7 @@ async def _fetch_device_info(location: str, known_ip: str | None = None) -> dict
             return None
 
         # Extract IP from base URL
-        import re
-
-        ip_match = re.search(r"//([^:]+)", base_url)
+        ip_match = _BASEURL_IP_RE.search(base_url)
         ip_address = ip_match.group(1) if ip_match else None
 
         # Fallback to known IP if we can't extract from base URL
@@ -228,6 +592,9 @@ async def _fetch_device_info(location: str, known_ip: str | None = None) -> dict
             "location": location,
         }
 
+        if etag or last_modified:
+            _DESCRIPTOR_CACHE[location] = (etag, last_modified, dict(device_info))
+
         _LOG.debug("Parsed device info: %s", device_info)
         return device_info
 
@@ -253,21 +620,17 @@ async def verify_device(ip_address: str) -> dict[str, Any] | None:
         }
     """
     try:
-        # Attempt to connect and get device info
-        from sony_client import SonyAudioDevice
-
-        device = SonyAudioDevice(ip_address)
-        try:
-            info = await device.get_device_info()
-            return {
-                "model": info.get("model", "Unknown"),
-                "version": info.get("version", ""),
-                "serial": info.get("serialNumber", ""),
-                "ip": ip_address,
-                "mac": info.get("macAddr", ""),
-            }
-        finally:
-            await device.close()
+        # Attempt to connect and get device info; the client borrows the shared
+        # session so verifying several devices does not set up a session each
+        device = SonyAudioDevice(ip_address, session=get_shared_session())
+        info = await device.get_device_info()
+        return {
+            "model": info.get("model", "Unknown"),
+            "version": info.get("version", ""),
+            "serial": info.get("serialNumber", ""),
+            "ip": ip_address,
+            "mac": info.get("macAddr", ""),
+        }
 
     except Exception as e:
         _LOG.error("Failed to verify device at %s: %s", ip_address, e)
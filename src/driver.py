@@ -7,67 +7,302 @@ Main integration driver that handles device discovery, setup, and control.
 
 import asyncio
 import logging
-import sys
+import logging.handlers
+import queue
+import time
 from pathlib import Path
 from typing import Any
 
-# Add src directory to Python path to support imports
-src_dir = Path(__file__).parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
-
 import ucapi
 from ucapi import remote
 
-from config import save_device_config
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - not available on every platform
+    uvloop = None
+
+import commands
+from commands import (
+    ENTITY_COMMANDS,
+    CommandParams,
+    device_input_maps,
+    device_mute,
+    device_settings_caches,
+    find_handler,
+)
+from config import get_all_devices, save_device_configs
 from discovery import discover_sony_devices, verify_device
-from remote_entity import create_remote_entity, discover_all_sources, get_input_uri_from_command
+from remote_entity import build_input_command_map, create_remote_entity, discover_all_sources
 from settings_cache import DeviceSettingsCache
-from sony_client import SonyApiError, SonyAudioDevice
+from sony_client import SonyApiError, SonyAudioDevice, close_shared_session, get_shared_session, zone_uri
 
 _LOG = logging.getLogger(__name__)
 
 # Global state
-loop = asyncio.new_event_loop()
-asyncio.set_event_loop(loop)
-api = ucapi.IntegrationAPI(loop)
+# Integration API, created in main() on the running event loop
+api: ucapi.IntegrationAPI | None = None
 
 # Device instances keyed by entity_id
 devices: dict[str, SonyAudioDevice] = {}
 device_sources: dict[str, list[dict[str, Any]]] = {}
-device_settings_caches: dict[str, DeviceSettingsCache] = {}
-polling_tasks: dict[str, asyncio.Task] = {}
+notification_tasks: dict[str, list[asyncio.Task]] = {}
+
+# Single task polling all devices, and its interval in seconds
+_polling_task: asyncio.Task | None = None
+POLL_INTERVAL = 30
+
+# A device whose state did not change is polled half as often each time, up to
+# POLL_MAX_INTERVAL seconds: (current interval, time.monotonic() of next poll) per entity_id
+POLL_MAX_INTERVAL = 600
+_poll_schedule: dict[str, tuple[float, float]] = {}
+
+# Entities the Remote is subscribed to; only these are polled
+subscribed_entities: set[str] = set()
+
+# Power status ("active"/"standby") pushed by the device, keyed by entity_id.
+# Only present while the notification connection is open, so entries are always current.
+device_power_state: dict[str, str] = {}
+_restore_task: asyncio.Task | None = None
+_log_listener: logging.handlers.QueueListener | None = None
 
+# Discovery timeout in seconds (the search ends earlier once replies stop), and how long a non-empty result is reused
+DISCOVERY_TIMEOUT = 3.0
+DISCOVERY_CACHE_TTL = 30.0
+_discovery_cache: tuple[float, list[dict[str, Any]]] | None = None
+# Discovery that keeps running while the user looks at an empty result, picked up by a retry
+_discovery_task: asyncio.Task | None = None
 
-async def poll_device_state(entity_id: str, device: SonyAudioDevice, interval: int = 30):
+# Device configs waiting to be written, and the task that writes them
+CONFIG_SAVE_DELAY = 0.25
+_pending_saves: dict[str, dict[str, Any]] = {}
+_save_task: asyncio.Task | None = None
+
+
+def schedule_config_save(device_id: str, device_config: dict[str, Any]) -> None:
     """
-    Periodically poll device state and update entity attributes.
+    Queue a device configuration to be saved shortly.
 
-    Detects external changes made via physical remote or other apps.
+    Saves requested within CONFIG_SAVE_DELAY are combined into one write,
+    which runs in a worker thread so file I/O does not block the event loop.
+
+    Args:
+        device_id: Device identifier
+        device_config: Device configuration to save
+    """
+    global _save_task  # pylint: disable=global-statement
+    _pending_saves[device_id] = device_config
+    if _save_task is None or _save_task.done():
+        _save_task = asyncio.create_task(_flush_config_saves())
+
+
+async def _flush_config_saves() -> None:
+    """Write all queued device configurations after a short delay, including ones queued while writing."""
+    while _pending_saves:
+        await asyncio.sleep(CONFIG_SAVE_DELAY)
+        updates = dict(_pending_saves)
+        _pending_saves.clear()
+        if not await asyncio.to_thread(save_device_configs, updates):
+            _LOG.error("Failed to save configuration for %s", ", ".join(updates))
+
+
+def _power_state(status: str) -> remote.States:
+    """Map a device power status ("active"/"standby") to the remote entity state."""
+    return remote.States.ON if status == "active" else remote.States.OFF
+
+
+def _set_entity_state(entity_id: str, state: remote.States) -> bool:
+    """
+    Update the state attribute of a configured entity if it changed.
+
+    Avoids sending an entity change event to the Remote for every command
+    that leaves the state as it was.
+
+    Args:
+        entity_id: Entity identifier
+        state: New entity state
+
+    Returns:
+        True if the state changed and was sent
+    """
+    entity = api.configured_entities.get(entity_id)
+    if not entity or entity.attributes.get(remote.Attributes.STATE) == state:
+        return False
+    api.configured_entities.update_attributes(entity_id, {remote.Attributes.STATE: state})
+    return True
+
+
+# Notifications to enable, per service
+DEVICE_NOTIFICATIONS = {
+    "system": ["notifyPowerStatus"],
+    "audio": ["notifyVolumeInformation"],
+}
+
+# Outputs whose volume notifications describe the main zone
+MAIN_ZONE_OUTPUTS = ("", zone_uri(1))
+
+
+async def start_notifications(entity_id: str, device: SonyAudioDevice) -> None:
+    """
+    Start listening for state notifications pushed by a device.
+
+    Listeners already running for the entity, e.g. from an earlier setup, are
+    stopped first.
 
     Args:
         entity_id: Entity identifier
         device: Device instance
-        interval: Polling interval in seconds
     """
-    while entity_id in devices:
+    previous = notification_tasks.pop(entity_id, [])
+    for task in previous:
+        task.cancel()
+    await asyncio.gather(*previous, return_exceptions=True)
+
+    notification_tasks[entity_id] = [
+        asyncio.create_task(_listen_notifications(entity_id, device, service, names))
+        for service, names in DEVICE_NOTIFICATIONS.items()
+    ]
+
+
+def _handle_notification(entity_id: str, name: str, payload: dict[str, Any]) -> None:
+    """Mirror a pushed device notification into the cached state."""
+    if name == "notifyPowerStatus":
+        status = payload.get("status", "")
+        device_power_state[entity_id] = status
+        _set_entity_state(entity_id, _power_state(status))
+    elif name == "notifyVolumeInformation" and payload.get("output", "") in MAIN_ZONE_OUTPUTS:
+        if "mute" in payload:
+            device_mute[entity_id] = (payload["mute"] == "on", time.monotonic())
+
+
+async def _listen_notifications(entity_id: str, device: SonyAudioDevice, service: str, names: list[str]) -> None:
+    """
+    Keep a notification connection to a device service open, reconnecting with backoff.
+
+    Args:
+        entity_id: Entity identifier
+        device: Device instance
+        service: Service name
+        names: Notification names to enable
+    """
+    delay = 1
+    # Stops once the entity is removed or set up again with another client
+    while devices.get(entity_id) is device:
+        started = time.monotonic()
         try:
-            await asyncio.sleep(interval)
-
-            # Get power status
-            status = await device.get_power_status()
-            new_state = remote.States.ON if status == "active" else remote.States.OFF
-
-            # Update if changed
-            current_entity = api.configured_entities.get(entity_id)
-            if current_entity and current_entity.attributes.get(remote.Attributes.STATE) != new_state:
-                _LOG.info("Device %s state changed externally to %s", entity_id, new_state)
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {remote.Attributes.STATE: new_state}
-                )
+            await device.listen_notifications(
+                service, names, lambda name, payload: _handle_notification(entity_id, name, payload)
+            )
         except Exception as e:
-            _LOG.debug("Error polling device %s: %s", entity_id, e)
+            _LOG.debug("Notification connection to %s/%s failed: %s", entity_id, service, e)
+
+        # Pushed state is no longer current once the connection is gone
+        if service == "system":
+            device_power_state.pop(entity_id, None)
+            _reset_poll_backoff(entity_id)
+
+        if time.monotonic() - started > 60:
+            delay = 1
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 60)
+
+
+def start_polling() -> None:
+    """Start the state polling task if it is not running yet."""
+    global _polling_task  # pylint: disable=global-statement
+    if _polling_task is None or _polling_task.done():
+        _polling_task = asyncio.create_task(poll_all_devices())
+
+
+async def poll_all_devices(interval: int = POLL_INTERVAL) -> None:
+    """
+    Periodically poll the state of all devices and update entity attributes.
+
+    Detects external changes made via physical remote or other apps. One task
+    polls every due device concurrently per interval, and only subscribed devices
+    without an open notification connection pushing their power state are polled. A device
+    whose state stays the same backs off to polling every POLL_MAX_INTERVAL seconds;
+    a state change or a command resets it.
+
+    Args:
+        interval: Base polling interval in seconds
+    """
+    while True:
+        await asyncio.sleep(interval)
+
+        # Pushed state is current; polling is only the fallback
+        now = time.monotonic()
+        polled = {
+            asyncio.create_task(device.get_power_status()): entity_id
+            for entity_id, device in devices.items()
+            if entity_id in subscribed_entities
+            and entity_id not in device_power_state
+            and _poll_schedule.get(entity_id, (0, 0))[1] <= now
+        }
+        if not polled:
+            continue
+
+        # A device that does not answer within the interval is skipped this round
+        try:
+            done, _ = await asyncio.wait(polled, timeout=interval)
+        finally:
+            for task in polled:
+                task.cancel()
+
+        now = time.monotonic()
+        for task, entity_id in polled.items():
+            changed = False
+            if task in done and task.exception():
+                _LOG.debug("Error polling device %s: %s", entity_id, task.exception())
+            elif task in done:
+                new_state = _power_state(task.result())
+
+                # Update if changed
+                changed = _set_entity_state(entity_id, new_state)
+                if changed:
+                    _LOG.info("Device %s state changed externally to %s", entity_id, new_state)
+
+            # Poll again after the base interval on a change, otherwise back off
+            next_interval = interval
+            if not changed and entity_id in _poll_schedule:
+                next_interval = min(_poll_schedule[entity_id][0] * 2, POLL_MAX_INTERVAL)
+            _poll_schedule[entity_id] = (next_interval, now + next_interval)
+
+
+def _reset_poll_backoff(entity_id: str) -> None:
+    """Poll a device at the base interval again, e.g. after a command may have changed its state."""
+    _poll_schedule.pop(entity_id, None)
+
+
+async def _discover_devices() -> list[dict[str, Any]]:
+    """
+    Discover devices, reusing a recent non-empty result.
+
+    Devices usually answer within a fraction of a second, so the search returns
+    as soon as no new device has replied for a moment instead of waiting out the timeout.
+
+    Returns:
+        List of discovered devices as returned by discover_sony_devices()
+    """
+    global _discovery_cache  # pylint: disable=global-statement
+
+    if _discovery_cache and time.monotonic() - _discovery_cache[0] < DISCOVERY_CACHE_TTL:
+        _LOG.debug("Using cached discovery result")
+        return _discovery_cache[1]
+
+    discovered = await discover_sony_devices(timeout=DISCOVERY_TIMEOUT)
+    if discovered:
+        _discovery_cache = (time.monotonic(), discovered)
+
+    return discovered
+
+
+def _cancel_background_discovery() -> None:
+    """Stop a discovery that was started for a possible retry."""
+    global _discovery_task  # pylint: disable=global-statement
+
+    if _discovery_task:
+        _discovery_task.cancel()
+        _discovery_task = None
 
 
 async def driver_setup_handler(msg: ucapi.SetupDriver) -> ucapi.SetupAction:
@@ -98,6 +333,8 @@ async def handle_driver_setup(msg: ucapi.DriverSetupRequest) -> ucapi.SetupActio
     Returns:
         Setup action
     """
+    _cancel_background_discovery()
+
     if msg.reconfigure:
         _LOG.info("Reconfiguring driver")
         # For reconfiguration, clear existing entities
@@ -123,58 +360,78 @@ async def handle_driver_setup(msg: ucapi.DriverSetupRequest) -> ucapi.SetupActio
         # Show device confirmation
         return await show_device_confirmation(device_info)
 
+    # Auto-discovery mode
+    return await _start_auto_discovery()
+
+
+async def _start_auto_discovery() -> ucapi.SetupAction:
+    """
+    Discover devices and ask the user to pick one.
+
+    Returns:
+        Setup action with the discovered devices, or a retry prompt if none were found
+    """
+    global _discovery_task  # pylint: disable=global-statement
+
+    # Join the search started when no devices were found last time; once it has finished,
+    # a device it found is in the discovery cache and an empty result is worth a new search
+    task, _discovery_task = _discovery_task, None
+    if task and not task.done():
+        _LOG.info("Waiting for running auto-discovery")
+        discovered = await task
     else:
-        # Auto-discovery mode
         _LOG.info("Starting auto-discovery")
-        discovered = await discover_sony_devices(timeout=5)
-
-        if not discovered:
-            return ucapi.RequestUserInput(
-                {"en": "No devices found"},
-                [
-                    {
-                        "id": "info",
-                        "label": {"en": "Discovery Result"},
-                        "field": {
-                            "label": {
-                                "value": {
-                                    "en": "No Sony Audio devices were found on the network.\n\n"
-                                    "Please ensure:\n"
-                                    "- Device is powered on\n"
-                                    "- Device is on the same network\n"
-                                    "- Network allows multicast traffic"
-                                }
-                            }
-                        },
-                    },
-                    {
-                        "id": "retry",
-                        "label": {"en": "Try again?"},
-                        "field": {"checkbox": {"value": False}},
-                    },
-                ],
-            )
-
-        # Create dropdown items from discovered devices
-        dropdown_items = [
-            {
-                "id": dev["ip"],
-                "label": {"en": f"{dev['name']} ({dev['model']}) - {dev['ip']}"},
-            }
-            for dev in discovered
-        ]
+        discovered = await _discover_devices()
 
+    if not discovered:
+        # Keep searching while the user reads the result so a retry can answer sooner
+        _discovery_task = asyncio.create_task(_discover_devices())
         return ucapi.RequestUserInput(
-            {"en": "Select Device"},
+            {"en": "No devices found"},
             [
                 {
-                    "id": "discovered_device",
-                    "label": {"en": "Discovered Devices"},
-                    "field": {"dropdown": {"value": discovered[0]["ip"], "items": dropdown_items}},
-                }
+                    "id": "info",
+                    "label": {"en": "Discovery Result"},
+                    "field": {
+                        "label": {
+                            "value": {
+                                "en": "No Sony Audio devices were found on the network.\n\n"
+                                "Please ensure:\n"
+                                "- Device is powered on\n"
+                                "- Device is on the same network\n"
+                                "- Network allows multicast traffic"
+                            }
+                        }
+                    },
+                },
+                {
+                    "id": "retry",
+                    "label": {"en": "Try again?"},
+                    "field": {"checkbox": {"value": False}},
+                },
             ],
         )
 
+    # Create dropdown items from discovered devices
+    dropdown_items = [
+        {
+            "id": dev["ip"],
+            "label": {"en": f"{dev['name']} ({dev['model']}) - {dev['ip']}"},
+        }
+        for dev in discovered
+    ]
+
+    return ucapi.RequestUserInput(
+        {"en": "Select Device"},
+        [
+            {
+                "id": "discovered_device",
+                "label": {"en": "Discovered Devices"},
+                "field": {"dropdown": {"value": discovered[0]["ip"], "items": dropdown_items}},
+            }
+        ],
+    )
+
 
 async def show_device_confirmation(device_info: dict[str, Any]) -> ucapi.SetupAction:
     """
@@ -240,7 +497,7 @@ async def handle_user_data_response(msg: ucapi.UserDataResponse) -> ucapi.SetupA
         # Create device and entity
         device = None
         try:
-            device = SonyAudioDevice(ip_address)
+            device = SonyAudioDevice(ip_address, session=get_shared_session())
             connected = await device.connect()
 
             if not connected:
@@ -254,21 +511,20 @@ async def handle_user_data_response(msg: ucapi.UserDataResponse) -> ucapi.SetupA
 
             _LOG.info("Creating entity %s for device %s", entity_id, info.get('model'))
 
-            # Create and initialize settings cache
+            # Create and initialize settings cache, and get complete sources for command handling;
+            # both are independent, so fetch them together
             settings_cache = DeviceSettingsCache(device)
-            await settings_cache.refresh()
+            _, sources = await asyncio.gather(settings_cache.refresh(), discover_all_sources(device))
             _LOG.info("Initialized settings cache for %s", entity_id)
 
             # Create remote entity with settings cache
-            entity = await create_remote_entity(device, entity_id, cmd_handler, settings_cache)
+            entity = await create_remote_entity(device, entity_id, cmd_handler, settings_cache, sources, info)
 
-            # Store device and cache
+            # Store device, cache and sources
             devices[entity_id] = device
             device_settings_caches[entity_id] = settings_cache
-
-            # Get and store complete sources for command handling
-            sources = await discover_all_sources(device)
             device_sources[entity_id] = sources
+            device_input_maps[entity_id] = build_input_command_map(sources)
 
             # Add entity to available AND configured entities
             # This makes it immediately usable after setup
@@ -278,13 +534,13 @@ async def handle_user_data_response(msg: ucapi.UserDataResponse) -> ucapi.SetupA
             # Get initial state
             try:
                 status = await device.get_power_status()
-                state = remote.States.ON if status == "active" else remote.States.OFF
-                api.configured_entities.update_attributes(entity_id, {remote.Attributes.STATE: state})
+                state = _power_state(status)
+                _set_entity_state(entity_id, state)
             except Exception as e:
                 _LOG.warning("Could not get initial state: %s", e)
 
             # Save configuration
-            save_device_config(
+            schedule_config_save(
                 entity_id,
                 {
                     "ip": ip_address,
@@ -294,8 +550,9 @@ async def handle_user_data_response(msg: ucapi.UserDataResponse) -> ucapi.SetupA
                 },
             )
 
-            # Start state polling task
-            polling_tasks[entity_id] = asyncio.create_task(poll_device_state(entity_id, device))
+            # Start state polling and notification tasks
+            start_polling()
+            await start_notifications(entity_id, device)
 
             _LOG.info("Setup complete for device %s", entity_id)
             return ucapi.SetupComplete()
@@ -319,10 +576,9 @@ async def handle_user_data_response(msg: ucapi.UserDataResponse) -> ucapi.SetupA
         return await show_device_confirmation(device_info)
 
     elif "retry" in msg.input_values:
-        # User wants to retry discovery
-        if msg.input_values["retry"] == "true":
-            # Start discovery again
-            return await handle_driver_setup(ucapi.DriverSetupRequest(False, {}))
+        # User wants to retry discovery; the checkbox value may arrive as bool or string
+        if msg.input_values["retry"] in (True, "true"):
+            return await _start_auto_discovery()
 
     _LOG.warning("Unhandled user data response, input_values: %s", msg.input_values)
     return ucapi.SetupError(error_type=ucapi.IntegrationSetupError.OTHER)
@@ -340,263 +596,33 @@ async def cmd_handler(entity: ucapi.Remote, cmd_id: str, params: dict[str, Any]
     Returns:
         Status code
     """
-    _LOG.info("Command: %s for entity %s, params: %s", cmd_id, entity.id, params)
+    if _LOG.isEnabledFor(logging.DEBUG):
+        _LOG.debug("Command: %s for entity %s, params: %s", cmd_id, entity.id, params)
 
     device = devices.get(entity.id)
     if not device:
         _LOG.error("Device not found for entity %s", entity.id)
         return ucapi.StatusCodes.SERVER_ERROR
 
-    try:
-        # Handle power commands
-        if cmd_id == remote.Commands.ON:
-            await device.set_power_status("active")
-            api.configured_entities.update_attributes(entity.id, {remote.Attributes.STATE: remote.States.ON})
-            return ucapi.StatusCodes.OK
-
-        elif cmd_id == remote.Commands.OFF:
-            await device.set_power_status("standby")
-            api.configured_entities.update_attributes(entity.id, {remote.Attributes.STATE: remote.States.OFF})
-            return ucapi.StatusCodes.OK
-
-        elif cmd_id == remote.Commands.TOGGLE:
-            # Get current state
-            current_state = entity.attributes.get(remote.Attributes.STATE)
-            if current_state == remote.States.OFF:
-                await device.set_power_status("active")
-                new_state = remote.States.ON
-            else:
-                await device.set_power_status("standby")
-                new_state = remote.States.OFF
-
-            api.configured_entities.update_attributes(entity.id, {remote.Attributes.STATE: new_state})
-            return ucapi.StatusCodes.OK
-
-        elif cmd_id == remote.Commands.SEND_CMD:
-            if not params:
-                return ucapi.StatusCodes.BAD_REQUEST
-
-            command = params.get("command")
-            if not command:
-                return ucapi.StatusCodes.BAD_REQUEST
-
-            # Handle different command types
-            if command == "POWER_ON":
-                await device.set_power_status("active")
-                api.configured_entities.update_attributes(entity.id, {remote.Attributes.STATE: remote.States.ON})
-
-            elif command == "POWER_OFF":
-                await device.set_power_status("standby")
-                api.configured_entities.update_attributes(entity.id, {remote.Attributes.STATE: remote.States.OFF})
-
-            elif command == "POWER_TOGGLE":
-                current_state = entity.attributes.get(remote.Attributes.STATE)
-                if current_state == remote.States.OFF:
-                    await device.set_power_status("active")
-                    new_state = remote.States.ON
-                else:
-                    await device.set_power_status("standby")
-                    new_state = remote.States.OFF
-                api.configured_entities.update_attributes(entity.id, {remote.Attributes.STATE: new_state})
-
-            elif command == "VOLUME_UP":
-                repeat = params.get("repeat", 1)
-                for _ in range(repeat):
-                    await device.set_volume("+1")
-
-            elif command == "VOLUME_DOWN":
-                repeat = params.get("repeat", 1)
-                for _ in range(repeat):
-                    await device.set_volume("-1")
-
-            elif command == "MUTE_ON":
-                await device.set_mute(True)
-
-            elif command == "MUTE_OFF":
-                await device.set_mute(False)
-
-            elif command == "MUTE_TOGGLE":
-                # Get current mute state
-                vol_info = await device.get_volume_info()
-                if vol_info and len(vol_info) > 0:
-                    current_mute = vol_info[0].get("mute", "off")
-                    await device.set_mute(current_mute == "off")
-
-            # Handle settings refresh command
-            elif command == "REFRESH_SETTINGS":
-                settings_cache = device_settings_caches.get(entity.id)
-                if settings_cache:
-                    await settings_cache.refresh()
-                    _LOG.info("Settings cache refreshed for device %s", entity.id)
-                return ucapi.StatusCodes.OK
-
-            # Dynamic sound settings (Sound Field, 360SSM, calibration, etc.)
-            elif command.startswith("SOUND_"):
-                settings_cache = device_settings_caches.get(entity.id)
-                if not settings_cache:
-                    _LOG.warning("No settings cache found for device %s", entity.id)
-                    return ucapi.StatusCodes.SERVER_ERROR
-
-                # Parse command: SOUND_<TARGET>_<VALUE> or SOUND_FIELD_<VALUE>
-                if command.startswith("SOUND_FIELD_"):
-                    # Extract value from SOUND_FIELD_<VALUE>
-                    value = command.replace("SOUND_FIELD_", "").lower()
-                    # Validate against settings cache
-                    if settings_cache.validate_setting_value("soundField", value):
-                        await device.set_sound_setting("soundField", value)
-                    else:
-                        _LOG.warning("Invalid sound field value: %s", value)
-                        return ucapi.StatusCodes.BAD_REQUEST
-
-                else:
-                    # Parse SOUND_<TARGET>_<VALUE>
-                    parts = command.split("_", 2)
-                    if len(parts) >= 3:
-                        target = parts[1].lower()
-                        value = parts[2].lower()
-
-                        # Validate setting exists and value is valid
-                        if settings_cache.validate_setting_value(target, value):
-                            await device.set_sound_setting(target, value)
-                        else:
-                            _LOG.warning("Invalid sound setting: %s = %s", target, value)
-                            return ucapi.StatusCodes.BAD_REQUEST
-
-            # Dynamic speaker level adjustments
-            elif command.startswith("SPEAKER_"):
-                settings_cache = device_settings_caches.get(entity.id)
-                if not settings_cache:
-                    _LOG.warning("No settings cache found for device %s", entity.id)
-                    return ucapi.StatusCodes.SERVER_ERROR
-
-                # Parse: SPEAKER_<NAME>_UP or SPEAKER_<NAME>_DOWN
-                if not (command.endswith("_UP") or command.endswith("_DOWN")):
-                    return ucapi.StatusCodes.BAD_REQUEST
-
-                direction = "up" if command.endswith("_UP") else "down"
-                # Remove SPEAKER_ prefix and _UP/_DOWN suffix
-                speaker_name = command[8:].rsplit("_", 1)[0]  # Remove "SPEAKER_" and "_UP"/"_DOWN"
-
-                # Find matching speaker setting in cache
-                speaker_controls = settings_cache.get_available_speaker_controls()
-                for target, title, min_val, max_val, step in speaker_controls:
-                    # Match target by removing "Level" suffix and comparing uppercase
-                    target_name = target.replace("Level", "").replace("level", "").upper()
-                    if target_name == speaker_name:
-                        # Get current value from cache
-                        current_value_str = settings_cache.get_current_value(target)
-                        if current_value_str is None:
-                            _LOG.warning("Could not get current value for %s", target)
-                            return ucapi.StatusCodes.SERVER_ERROR
-
-                        current_value = float(current_value_str)
-
-                        # Calculate new value
-                        if direction == "up":
-                            new_value = min(current_value + step, max_val)
-                        else:
-                            new_value = max(current_value - step, min_val)
-
-                        # Set new value
-                        await device.set_speaker_level(target, new_value)
-                        _LOG.info("Set %s to %.1f dB", target, new_value)
-
-                        # Refresh cache to get new value
-                        await settings_cache.refresh()
-                        return ucapi.StatusCodes.OK
-
-                _LOG.warning("Unknown speaker control: %s", speaker_name)
-                return ucapi.StatusCodes.BAD_REQUEST
-
-            # Dynamic multi-zone controls
-            elif command.startswith("ZONE"):
-                settings_cache = device_settings_caches.get(entity.id)
-                if not settings_cache:
-                    _LOG.warning("No settings cache found for device %s", entity.id)
-                    return ucapi.StatusCodes.SERVER_ERROR
-
-                # Extract zone number from ZONE<N>_<CMD>
-                try:
-                    zone = int(command[4])
-                    cmd_type = command[6:]  # Skip "ZONE<N>_"
-                except (ValueError, IndexError):
-                    _LOG.warning("Invalid zone command format: %s", command)
-                    return ucapi.StatusCodes.BAD_REQUEST
-
-                # Validate zone exists on this device
-                if zone not in settings_cache.zones:
-                    _LOG.warning("Zone %d not available on this device", zone)
-                    return ucapi.StatusCodes.BAD_REQUEST
-
-                # Handle zone commands
-                if cmd_type == "VOLUME_UP":
-                    await device.set_zone_volume(zone, "+1")
-                elif cmd_type == "VOLUME_DOWN":
-                    await device.set_zone_volume(zone, "-1")
-                elif cmd_type == "MUTE_TOGGLE":
-                    vol_info = await device.get_zone_volume(zone)
-                    current_mute = vol_info.get("mute", "off")
-                    await device.set_zone_mute(zone, current_mute == "off")
-                elif cmd_type == "ACTIVATE":
-                    zone_uri = f"extOutput:zone?zone={zone}"
-                    await device.set_active_terminal(zone_uri, True)
-                elif cmd_type == "DEACTIVATE":
-                    zone_uri = f"extOutput:zone?zone={zone}"
-                    await device.set_active_terminal(zone_uri, False)
-                else:
-                    _LOG.warning("Unknown zone command type: %s", cmd_type)
-                    return ucapi.StatusCodes.BAD_REQUEST
-
-            # Dynamic system controls (dimmer, HDMI output)
-            # These are actually sound settings, handled dynamically
-            elif command.startswith("SYSTEM_"):
-                settings_cache = device_settings_caches.get(entity.id)
-                if not settings_cache:
-                    _LOG.warning("No settings cache found for device %s", entity.id)
-                    return ucapi.StatusCodes.SERVER_ERROR
-
-                # Parse SYSTEM_<TARGET>_<VALUE>
-                if command.startswith("SYSTEM_DIMMER_"):
-                    target = "dimmer"
-                    value = command.replace("SYSTEM_DIMMER_", "").lower()
-                elif command.startswith("SYSTEM_HDMI_OUTPUT_"):
-                    target = "hdmiOutput"
-                    value = command.replace("SYSTEM_HDMI_OUTPUT_", "").lower()
-                    # Handle special case mappings for HDMI output
-                    value_map = {"a": "hdmi_A", "b": "hdim_B", "ab": "hdmi_AB", "off": "off"}
-                    value = value_map.get(value, value)
-                else:
-                    _LOG.warning("Unknown system command: %s", command)
-                    return ucapi.StatusCodes.BAD_REQUEST
-
-                # Validate and set
-                if settings_cache.validate_setting_value(target, value):
-                    await device.set_sound_setting(target, value)
-                else:
-                    _LOG.warning("Invalid system setting: %s = %s", target, value)
-                    return ucapi.StatusCodes.BAD_REQUEST
-
-            elif command.startswith("INPUT_"):
-                # Handle input switching
-                sources = device_sources.get(entity.id, [])
-                uri = get_input_uri_from_command(command, sources)
-
-                if uri:
-                    await device.switch_input(uri)
-                else:
-                    _LOG.warning("Unknown input command: %s", command)
-                    return ucapi.StatusCodes.BAD_REQUEST
-
-            else:
-                _LOG.warning("Unknown command: %s", command)
-                return ucapi.StatusCodes.BAD_REQUEST
-
-            return ucapi.StatusCodes.OK
-
-        else:
-            _LOG.warning("Unsupported command: %s", cmd_id)
-            return ucapi.StatusCodes.NOT_IMPLEMENTED
+    if cmd_id in ENTITY_COMMANDS:
+        cmd = CommandParams(ENTITY_COMMANDS[cmd_id])
+    elif cmd_id == remote.Commands.SEND_CMD:
+        cmd = CommandParams.parse(params)
+        if cmd is None:
+            _LOG.warning("Invalid command parameters: %s", params)
+            return ucapi.StatusCodes.BAD_REQUEST
+    else:
+        _LOG.warning("Unsupported command: %s", cmd_id)
+        return ucapi.StatusCodes.NOT_IMPLEMENTED
 
+    handler = find_handler(cmd.command)
+    if handler is None:
+        _LOG.warning("Unknown command: %s", cmd.command)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    _reset_poll_backoff(entity.id)
+    try:
+        return await handler(device, entity, cmd)
     except SonyApiError as e:
         _LOG.error("Sony API error: %s", e)
         return ucapi.StatusCodes.SERVER_ERROR
@@ -605,32 +631,27 @@ async def cmd_handler(entity: ucapi.Remote, cmd_id: str, params: dict[str, Any]
         return ucapi.StatusCodes.SERVER_ERROR
 
 
-@api.listens_to(ucapi.Events.CONNECT)
 async def on_connect() -> None:
     """Handle connection from Remote."""
     _LOG.info("Remote connected")
     await api.set_device_state(ucapi.DeviceStates.CONNECTED)
 
 
-@api.listens_to(ucapi.Events.DISCONNECT)
 async def on_disconnect() -> None:
     """Handle disconnection from Remote."""
     _LOG.info("Remote disconnected")
 
 
-@api.listens_to(ucapi.Events.ENTER_STANDBY)
 async def on_standby() -> None:
     """Handle Remote entering standby."""
     _LOG.info("Remote entering standby")
 
 
-@api.listens_to(ucapi.Events.EXIT_STANDBY)
 async def on_exit_standby() -> None:
     """Handle Remote exiting standby."""
     _LOG.info("Remote exiting standby")
 
 
-@api.listens_to(ucapi.Events.SUBSCRIBE_ENTITIES)
 async def on_subscribe_entities(entity_ids: list[str]) -> None:
     """
     Handle entity subscription.
@@ -639,19 +660,32 @@ async def on_subscribe_entities(entity_ids: list[str]) -> None:
         entity_ids: List of entity IDs to subscribe to
     """
     _LOG.info("Subscribed to entities: %s", entity_ids)
-    # Update entity states
+    subscribed_entities.update(entity_ids)
+
+    # Devices with an open notification connection already pushed their current state
     for entity_id in entity_ids:
-        device = devices.get(entity_id)
-        if device:
-            try:
-                status = await device.get_power_status()
-                state = remote.States.ON if status == "active" else remote.States.OFF
-                api.configured_entities.update_attributes(entity_id, {remote.Attributes.STATE: state})
-            except Exception as e:
-                _LOG.error("Error updating entity %s state: %s", entity_id, e)
+        if entity_id in devices and entity_id in device_power_state:
+            state = _power_state(device_power_state[entity_id])
+            _set_entity_state(entity_id, state)
+
+    # Query the remaining devices all at once
+    subscribed = [
+        (entity_id, devices[entity_id])
+        for entity_id in entity_ids
+        if entity_id in devices and entity_id not in device_power_state
+    ]
+    statuses = await asyncio.gather(
+        *(device.get_power_status() for _, device in subscribed),
+        return_exceptions=True,
+    )
+    for (entity_id, _), status in zip(subscribed, statuses):
+        if isinstance(status, BaseException):
+            _LOG.error("Error updating entity %s state: %s", entity_id, status)
+            continue
+        state = _power_state(status)
+        _set_entity_state(entity_id, state)
 
 
-@api.listens_to(ucapi.Events.UNSUBSCRIBE_ENTITIES)
 async def on_unsubscribe_entities(entity_ids: list[str]) -> None:
     """
     Handle entity unsubscription.
@@ -660,85 +694,188 @@ async def on_unsubscribe_entities(entity_ids: list[str]) -> None:
         entity_ids: List of entity IDs to unsubscribe from
     """
     _LOG.info("Unsubscribed from entities: %s", entity_ids)
+    # Nobody sees the state of these entities; stop polling them until they are subscribed again
+    for entity_id in entity_ids:
+        subscribed_entities.discard(entity_id)
+        _reset_poll_backoff(entity_id)
+
+
+async def _restore_device(device_id: str, config: dict[str, Any]) -> tuple | None:
+    """
+    Reconnect to a configured device and build its entity.
+
+    Only talks to the device; registering the result with the driver state
+    is left to the caller so restores can run concurrently.
+
+    Args:
+        device_id: Entity identifier from the configuration
+        config: Stored device configuration
+
+    Returns:
+        Tuple of (device, settings cache, entity, sources, initial state or None),
+        or None if the device could not be reached
+    """
+    ip_address = config["ip"]
+    device = SonyAudioDevice(ip_address, session=get_shared_session())
+
+    try:
+        if not await device.connect():
+            _LOG.warning("Could not reconnect to device %s at %s", device_id, ip_address)
+            await device.close()
+            return None
+
+        # Settings cache, complete sources and initial state are independent, so fetch them together
+        settings_cache = DeviceSettingsCache(device)
+        _, sources, state = await asyncio.gather(
+            settings_cache.refresh(), discover_all_sources(device), _get_initial_state(device_id, device)
+        )
+        _LOG.info("Initialized settings cache for %s", device_id)
+
+        # Create remote entity with settings cache, naming it from the saved config
+        saved_info = {"model": config["model"]} if config.get("model", "Unknown") != "Unknown" else None
+        entity = await create_remote_entity(device, device_id, cmd_handler, settings_cache, sources, saved_info)
+    except Exception:
+        await device.close()
+        raise
+
+    return device, settings_cache, entity, sources, state
+
+
+async def _get_initial_state(device_id: str, device: SonyAudioDevice) -> remote.States | None:
+    """Get the entity state matching the device power status, or None if it cannot be read."""
+    try:
+        status = await device.get_power_status()
+    except Exception as e:
+        _LOG.warning("Could not get initial state for %s: %s", device_id, e)
+        return None
+    return _power_state(status)
+
+
+async def restore_configured_devices() -> None:
+    """Reconnect to all previously configured devices and register their entities."""
+    # Read the configuration file off the event loop so Remote requests are served meanwhile
+    configured = await asyncio.to_thread(get_all_devices)
+
+    # Connect to all devices concurrently; registration happens afterwards in config order
+    results = await asyncio.gather(
+        *(_restore_device(device_id, config) for device_id, config in configured.items()),
+        return_exceptions=True,
+    )
+
+    for device_id, result in zip(configured, results):
+        if isinstance(result, BaseException):
+            _LOG.error("Error restoring device %s: %s", device_id, result)
+            continue
+        if result is None:
+            continue
+
+        device, settings_cache, entity, sources, state = result
+        devices[device_id] = device
+        device_settings_caches[device_id] = settings_cache
+        device_sources[device_id] = sources
+        device_input_maps[device_id] = build_input_command_map(sources)
+
+        # Add to both available and configured entities
+        api.available_entities.add(entity)
+        api.configured_entities.add(entity)
+
+        # Set initial state
+        if state is not None:
+            _set_entity_state(device_id, state)
+
+        # Start state polling and notification tasks
+        start_polling()
+        await start_notifications(device_id, device)
+
+        _LOG.info("Restored device %s from configuration", device_id)
+
+
+async def shutdown() -> None:
+    """Stop background tasks, write pending configuration and close device connections."""
+    _LOG.info("Shutting down...")
+
+    # Cancel startup restore, discovery, polling and notification tasks, and let them
+    # finish before their connections are closed
+    _cancel_background_discovery()
+    tasks = [task for task in (_restore_task, _polling_task) if task]
+    tasks.extend(task for device_tasks in list(notification_tasks.values()) for task in device_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Let a running save finish, as its worker thread can't be interrupted; it also writes
+    # changes queued meanwhile. Anything still waiting is written the same way
+    if _save_task:
+        await asyncio.gather(_save_task, return_exceptions=True)
+    if _pending_saves:
+        updates = dict(_pending_saves)
+        _pending_saves.clear()
+        if not await asyncio.to_thread(save_device_configs, updates):
+            _LOG.error("Failed to save configuration for %s", ", ".join(updates))
+
+    # Clean up device connections
+    await asyncio.gather(*(device.close() for device in list(devices.values())), return_exceptions=True)
+
+    # Close the session shared by all devices once they are done with it
+    try:
+        await close_shared_session()
+    except Exception:
+        pass
+
+    # Flush remaining log records
+    if _log_listener:
+        _log_listener.stop()
 
 
 async def main() -> None:
     """Main entry point."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    # Log records are handed to a background thread so writing them never blocks the event loop
+    global _log_listener  # pylint: disable=global-statement
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(
+        logging.Formatter("%(asctime)s | %(levelname)-8s | %(name)s | %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
     )
+    _log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+    _log_listener.start()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))  # the listener applies the real format
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
     _LOG.info("Starting Sony Audio Control integration driver")
 
-    # Initialize the integration API
+    # Initialize the integration API on the running loop
+    global api  # pylint: disable=global-statement
+    api = ucapi.IntegrationAPI(asyncio.get_running_loop())
+    api.add_listener(ucapi.Events.CONNECT, on_connect)
+    api.add_listener(ucapi.Events.DISCONNECT, on_disconnect)
+    api.add_listener(ucapi.Events.ENTER_STANDBY, on_standby)
+    api.add_listener(ucapi.Events.EXIT_STANDBY, on_exit_standby)
+    api.add_listener(ucapi.Events.SUBSCRIBE_ENTITIES, on_subscribe_entities)
+    api.add_listener(ucapi.Events.UNSUBSCRIBE_ENTITIES, on_unsubscribe_entities)
+    commands.entity_state_setter = _set_entity_state
+
     # driver.json is in the parent directory
     driver_json_path = Path(__file__).parent.parent / "driver.json"
     await api.init(str(driver_json_path), driver_setup_handler)
 
-    # Load previously configured devices
-    from config import get_all_devices
+    # Restore configured devices in the background so the integration is
+    # reachable right away; entities become available as devices respond
+    global _restore_task  # pylint: disable=global-statement
+    _restore_task = asyncio.create_task(restore_configured_devices())
 
-    configured = get_all_devices()
-    for device_id, config in configured.items():
-        try:
-            ip_address = config["ip"]
-            device = SonyAudioDevice(ip_address)
-
-            if await device.connect():
-                # Create and initialize settings cache
-                settings_cache = DeviceSettingsCache(device)
-                await settings_cache.refresh()
-                _LOG.info("Initialized settings cache for %s", device_id)
-
-                # Create remote entity with settings cache
-                entity = await create_remote_entity(device, device_id, cmd_handler, settings_cache)
-                devices[device_id] = device
-                device_settings_caches[device_id] = settings_cache
-                
-                # Get and store complete sources for command handling
-                sources = await discover_all_sources(device)
-                device_sources[device_id] = sources
-                
-                # Add to both available and configured entities
-                api.available_entities.add(entity)
-                api.configured_entities.add(entity)
-                
-                # Set initial state
-                try:
-                    status = await device.get_power_status()
-                    state = remote.States.ON if status == "active" else remote.States.OFF
-                    api.configured_entities.update_attributes(device_id, {remote.Attributes.STATE: state})
-                except Exception as e:
-                    _LOG.warning("Could not get initial state for %s: %s", device_id, e)
-                
-                # Start state polling task
-                polling_tasks[device_id] = asyncio.create_task(poll_device_state(device_id, device))
-                
-                _LOG.info("Restored device %s from configuration", device_id)
-            else:
-                _LOG.warning("Could not reconnect to device %s at %s", device_id, ip_address)
-                await device.close()
-
-        except Exception as e:
-            _LOG.error("Error restoring device %s: %s", device_id, e)
+    try:
+        # Serve until the process is interrupted
+        await asyncio.Event().wait()
+    finally:
+        await shutdown()
 
 
 if __name__ == "__main__":
+    if uvloop:
+        # uvloop's libuv-based loop handles the many small device requests faster when it is installed
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
-        loop.run_until_complete(main())
-        loop.run_forever()
+        asyncio.run(main())
     except KeyboardInterrupt:
-        _LOG.info("Shutting down...")
-    finally:
-        # Cancel polling tasks
-        for task in polling_tasks.values():
-            task.cancel()
-        
-        # Clean up device connections
-        for device in devices.values():
-            try:
-                loop.run_until_complete(device.close())
-            except Exception:
-                pass
+        pass
@@ -4,12 +4,15 @@ Remote entity builder for Sony Audio devices.
 Creates remote entities with dynamic commands based on device capabilities.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Any
+import re
+from typing import Any, NamedTuple
 
 import ucapi
 from ucapi import remote
-from ucapi.ui import Buttons, Size, UiPage, create_btn_mapping, create_ui_icon, create_ui_text
+from ucapi.ui import Buttons, Size, UiItem, UiPage, create_btn_mapping, create_ui_icon, create_ui_text
 
 from settings_cache import DeviceSettingsCache
 from sony_client import SonyAudioDevice
@@ -17,6 +20,82 @@ from sony_client import SonyAudioDevice
 _LOG = logging.getLogger(__name__)
 
 
+_INPUT_URI_PREFIX = "extInput:"
+_HDMI_PORT_PREFIX = "extInput:hdmi?port="
+_INPUT_URI_PREFIX_LEN = len(_INPUT_URI_PREFIX)
+_HDMI_PORT_PREFIX_LEN = len(_HDMI_PORT_PREFIX)
+
+# Source types of the generic inputs, by input name
+_GENERIC_SOURCE_TYPES = {
+    "tv": "tv",
+    "btAudio": "bluetooth",
+    "line": "analog",
+    "airPlay": "airplay",
+    "usb": "usb",
+}
+
+# Icons of the generic input types; labeled inputs get one matching their name
+_SOURCE_ICONS = {
+    "hdmi": "uc:hdmi",
+    "tv": "uc:tv",
+    "bluetooth": "uc:bluetooth",
+    "analog": "uc:line-in",
+    "airplay": "uc:airplay",
+}
+
+# Icons of labeled inputs by name fragment; the leftmost fragment found in the input name wins
+_LABELED_INPUT_ICONS = {
+    "game": "uc:gaming",
+    "bd": "uc:disc",
+    "dvd": "uc:disc",
+    "sat": "uc:satellite",
+    "catv": "uc:satellite",
+    "cable": "uc:satellite",
+    "cd": "uc:music",
+    "video": "uc:video",
+}
+_LABELED_INPUT_ICON_RE = re.compile("|".join(_LABELED_INPUT_ICONS))
+
+# Characters of labeled input names that become underscores in command names
+_COMMAND_NAME_TRANS = str.maketrans("- ", "__")
+
+# Basic commands (always available)
+_BASIC_COMMANDS = (
+    "POWER_ON",
+    "POWER_OFF",
+    "POWER_TOGGLE",
+    "VOLUME_UP",
+    "VOLUME_DOWN",
+    "MUTE_ON",
+    "MUTE_OFF",
+    "MUTE_TOGGLE",
+)
+
+# Button mappings every device gets
+_BASIC_BUTTON_MAPPINGS = (
+    # === Power Control ===
+    create_btn_mapping(Buttons.POWER, "POWER_TOGGLE"),
+    # === Volume Controls ===
+    create_btn_mapping(Buttons.VOLUME_UP, "VOLUME_UP"),
+    create_btn_mapping(Buttons.VOLUME_DOWN, "VOLUME_DOWN"),
+    create_btn_mapping(Buttons.MUTE, "MUTE_TOGGLE"),
+)
+
+# Fixed controls of the main page, below the device name
+_MAIN_PAGE_CONTROLS = (
+    # Power buttons
+    create_ui_icon("uc:power-on", 0, 1, cmd="POWER_ON"),
+    create_ui_icon("uc:power-off", 1, 1, cmd="POWER_OFF"),
+    # Volume controls
+    create_ui_icon("uc:volume-up", 0, 2, cmd="VOLUME_UP"),
+    create_ui_icon("uc:volume-down", 1, 2, cmd="VOLUME_DOWN"),
+    create_ui_icon("uc:mute", 2, 2, cmd="MUTE_TOGGLE"),
+)
+
+# Input types the channel buttons cycle through
+_CYCLED_SOURCE_TYPES = ("hdmi", "tv", "bluetooth", "analog", "airplay")
+
+
 def parse_source_uri(source_uri: str) -> dict[str, str]:
     """
     Parse source URI and extract input type and identifier.
@@ -27,23 +106,20 @@ def parse_source_uri(source_uri: str) -> dict[str, str]:
     Returns:
         Dict with 'type' and 'id' fields
     """
-    if "hdmi" in source_uri and "port=" in source_uri:
-        port = source_uri.split("port=")[1].split("&")[0]
-        return {"type": "hdmi", "id": port}
-    elif "tv" in source_uri:
-        return {"type": "tv", "id": ""}
-    elif "btAudio" in source_uri:
-        return {"type": "bluetooth", "id": ""}
-    elif "line" in source_uri:
-        return {"type": "analog", "id": ""}
-    elif "airPlay" in source_uri:
-        return {"type": "airplay", "id": ""}
-    elif "usb" in source_uri:
-        return {"type": "usb", "id": ""}
-    elif source_uri.startswith("extInput:"):
-        input_name = source_uri.split("extInput:")[1].split("?")[0]
-        return {"type": "labeled", "id": input_name}
-    return {"type": "unknown", "id": ""}
+    if not source_uri.startswith(_INPUT_URI_PREFIX):
+        return {"type": "unknown", "id": ""}
+
+    # Devices put the port first; other parameter orders are still accepted
+    if source_uri.startswith(_HDMI_PORT_PREFIX):
+        return {"type": "hdmi", "id": source_uri[_HDMI_PORT_PREFIX_LEN:].partition("&")[0]}
+    name, _, query = source_uri[_INPUT_URI_PREFIX_LEN:].partition("?")
+    if name == "hdmi":
+        for param in query.split("&"):
+            if param.startswith("port="):
+                return {"type": "hdmi", "id": param[5:]}
+    if name in _GENERIC_SOURCE_TYPES:
+        return {"type": _GENERIC_SOURCE_TYPES[name], "id": ""}
+    return {"type": "labeled", "id": name}
 
 
 async def discover_all_sources(device: SonyAudioDevice) -> list[dict[str, Any]]:
@@ -61,17 +137,26 @@ async def discover_all_sources(device: SonyAudioDevice) -> list[dict[str, Any]]:
     """
     sources = []
 
+    # Both queries are independent; run them together
+    basic_sources, terminals = await asyncio.gather(
+        device.get_source_list("extInput"),
+        device.get_external_terminals_status(""),
+        return_exceptions=True,
+    )
+
     # Method 1: getSourceList
-    try:
-        basic_sources = await device.get_source_list("extInput")
+    if isinstance(basic_sources, Exception):
+        _LOG.warning("Could not get source list: %s", basic_sources)
+    else:
         _LOG.info("getSourceList found %d sources", len(basic_sources))
         sources.extend(basic_sources)
-    except Exception as e:
-        _LOG.warning("Could not get source list: %s", e)
 
     # Method 2: getCurrentExternalTerminalsStatus
+    if isinstance(terminals, Exception):
+        _LOG.debug("Could not get terminal status: %s", terminals)
+        return sources
+
     try:
-        terminals = await device.get_external_terminals_status("")
         input_terminals = [t for t in terminals if t.get("uri", "").startswith("extInput:")]
         _LOG.info("Terminal status found %d input terminals", len(input_terminals))
 
@@ -96,95 +181,193 @@ async def discover_all_sources(device: SonyAudioDevice) -> list[dict[str, Any]]:
     return sources
 
 
-def create_simple_commands(sources: list[dict[str, Any]], settings_cache: DeviceSettingsCache) -> list[str]:
+def _get_source_icon(source_type: str, source_id: str) -> str:
+    """Get the UI icon for a parsed source."""
+    if source_type != "labeled":
+        return _SOURCE_ICONS.get(source_type, "uc:input")
+
+    # Use appropriate icon based on input name
+    match = _LABELED_INPUT_ICON_RE.search(source_id.lower())
+    return _LABELED_INPUT_ICONS[match.group()] if match else "uc:input"
+
+
+@functools.lru_cache(maxsize=128)
+def _classify_source_uri(source_uri: str) -> tuple[str, str, str] | None:
     """
-    Create list of simple commands for remote entity (dynamically generated).
+    Classify a source URI into its input type, command and icon.
+
+    This is the one place deciding what an input is called and shown as.
+    Cached, since the same URIs are classified for the entity and for the
+    device's command map, and again whenever a device is set up or restored.
+
+    Args:
+        source_uri: Source URI string (e.g., "extInput:hdmi?port=1")
+
+    Returns:
+        (type, command, icon) tuple, or None if the URI is not an input
+    """
+    parsed = parse_source_uri(source_uri)
+    source_type, source_id = parsed["type"], parsed["id"]
+    if source_type == "unknown":
+        return None
+
+    if source_type == "hdmi":
+        command = f"INPUT_HDMI{source_id}"
+    elif source_type == "labeled":
+        # Labeled inputs like game, bd-dvd, sat-catv, mediaBox: uppercase the name
+        # and replace hyphens/spaces with underscores
+        command = f"INPUT_{source_id.upper().translate(_COMMAND_NAME_TRANS)}"
+    else:
+        command = f"INPUT_{source_type.upper()}"
+    return source_type, command, _get_source_icon(source_type, source_id)
+
+
+def get_input_command(source_uri: str) -> str | None:
+    """
+    Get the input command name for a source URI.
+
+    Args:
+        source_uri: Source URI string (e.g., "extInput:hdmi?port=1")
+
+    Returns:
+        Command string (e.g., "INPUT_HDMI1", "INPUT_BD_DVD") or None if the URI is not an input
+    """
+    classified = _classify_source_uri(source_uri)
+    return classified[1] if classified else None
+
+
+class _SourceInfo(NamedTuple):
+    """Input source with its derived command and icon."""
+
+    cmd: str
+    icon: str
+    title: str
+    uri: str
+    type: str
+    label: str  # Title truncated to fit an inputs page button
+
+
+def _classify_sources(sources: list[dict[str, Any]]) -> list[_SourceInfo]:
+    """
+    Derive command and icon of each input source once for all entity builders.
+
+    Args:
+        sources: List of input sources
+
+    Returns:
+        Info of each source that maps to an input command, in source order
+    """
+    infos = []
+    for source in sources:
+        source_uri = source.get("source", "")
+        classified = _classify_source_uri(source_uri)
+        if classified:
+            source_type, cmd, icon = classified
+            title = source.get("title", "Unknown")
+            infos.append(_SourceInfo(cmd, icon, title, source_uri, source_type, title[:12]))
+    return infos
+
+
+def build_input_command_map(sources: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    Map input command names to source URIs.
+
+    Built once per device when its sources are discovered so input commands
+    can be resolved without scanning the source list on every press.
+
+    Args:
+        sources: List of input sources
+
+    Returns:
+        Dict of command string to source URI; the first source wins for duplicates
+    """
+    command_map: dict[str, str] = {}
+    for info in _classify_sources(sources):
+        command_map.setdefault(info.cmd, info.uri)
+    return command_map
+
+
+class _DeviceCapabilities(NamedTuple):
+    """Settings lists of a device, read once from its settings cache for all entity builders."""
+
+    has_sound_settings: bool
+    sound_fields: list[tuple[str, str]]
+    boolean_settings: list[tuple[str, str, list[str]]]
+    speaker_controls: list[tuple[str, str, float, float, float]]
+    zones: list[int]
+
+
+def _collect_capabilities(settings_cache: DeviceSettingsCache) -> _DeviceCapabilities:
+    """
+    Read the available settings of a device once for all entity builders.
 
     Args:
-        sources: List of input sources from get_source_list()
         settings_cache: Device settings cache with discovered capabilities
 
+    Returns:
+        Capabilities shared by create_simple_commands() and create_ui_pages()
+    """
+    return _DeviceCapabilities(
+        bool(settings_cache.sound_settings),
+        settings_cache.get_available_sound_field_values(),
+        settings_cache.get_available_boolean_settings(),
+        settings_cache.get_available_speaker_controls(),
+        settings_cache.zones,
+    )
+
+
+def _speaker_command_base(target: str) -> str:
+    """Get the SPEAKER_<NAME> command prefix of a speaker level target (e.g. "centerLevel" -> "SPEAKER_CENTER")."""
+    # Create friendly name by removing "Level" suffix
+    return "SPEAKER_" + target.replace("Level", "").replace("level", "").upper()
+
+
+def create_simple_commands(sources: list[_SourceInfo], capabilities: _DeviceCapabilities) -> list[str]:
+    """
+    Create list of simple commands for remote entity (dynamically generated).
+
+    Args:
+        sources: Classified input sources from _classify_sources()
+        capabilities: Device capabilities from _collect_capabilities()
+
     Returns:
         List of command strings based on device capabilities
     """
-    commands = [
-        # Basic commands (always available)
-        "POWER_ON",
-        "POWER_OFF",
-        "POWER_TOGGLE",
-        "VOLUME_UP",
-        "VOLUME_DOWN",
-        "MUTE_ON",
-        "MUTE_OFF",
-        "MUTE_TOGGLE",
-    ]
+    commands = list(_BASIC_COMMANDS)
 
     # Dynamic sound field commands
-    sound_field_values = settings_cache.get_available_sound_field_values()
-    for value, title in sound_field_values:
-        cmd = f"SOUND_FIELD_{value.upper()}"
-        commands.append(cmd)
-        _LOG.debug("Added sound field command: %s (%s)", cmd, title)
+    sound_field_values = capabilities.sound_fields
+    commands += [f"SOUND_FIELD_{value.upper()}" for value, _ in sound_field_values]
 
     # Dynamic boolean/enum settings (360SSM, DSD Native, Pure Direct, Calibration, Dimmer, HDMI)
-    boolean_settings = settings_cache.get_available_boolean_settings()
-    for target, title, values in boolean_settings:
-        for value in values:
-            cmd = f"SOUND_{target.upper()}_{value.upper()}"
-            commands.append(cmd)
-            _LOG.debug("Added sound setting command: %s", cmd)
+    boolean_settings = capabilities.boolean_settings
+    commands += [
+        f"SOUND_{target.upper()}_{value.upper()}" for target, _, values in boolean_settings for value in values
+    ]
 
     # Dynamic speaker level commands
-    speaker_controls = settings_cache.get_available_speaker_controls()
-    for target, title, min_val, max_val, step in speaker_controls:
-        # Create friendly name by removing "Level" suffix
-        base_name = target.replace("Level", "").replace("level", "")
-        # Convert camelCase to UPPER_SNAKE_CASE
-        base_cmd = f"SPEAKER_{base_name.upper()}"
-        commands.extend([f"{base_cmd}_UP", f"{base_cmd}_DOWN"])
-        _LOG.debug("Added speaker commands: %s_UP/DOWN (%s)", base_cmd, title)
+    speaker_controls = capabilities.speaker_controls
+    speaker_bases = [_speaker_command_base(target) for target, *_ in speaker_controls]
+    commands += [base_cmd + suffix for base_cmd in speaker_bases for suffix in ("_UP", "_DOWN")]
 
     # Dynamic zone commands
-    for zone in settings_cache.zones:
-        commands.extend([
-            f"ZONE{zone}_VOLUME_UP",
-            f"ZONE{zone}_VOLUME_DOWN",
-            f"ZONE{zone}_MUTE_TOGGLE",
-        ])
+    for zone in capabilities.zones:
+        prefix = f"ZONE{zone}"
+        commands.extend([prefix + "_VOLUME_UP", prefix + "_VOLUME_DOWN", prefix + "_MUTE_TOGGLE"])
         if zone > 1:  # Only non-main zones can be activated/deactivated
-            commands.extend([f"ZONE{zone}_ACTIVATE", f"ZONE{zone}_DEACTIVATE"])
-        _LOG.debug("Added zone %d commands", zone)
+            commands.extend([prefix + "_ACTIVATE", prefix + "_DEACTIVATE"])
+
+    # One summary instead of a line per command
+    _LOG.debug(
+        "Added commands for %d sound fields, %d sound settings, %d speakers and %d zones",
+        len(sound_field_values),
+        len(boolean_settings),
+        len(speaker_controls),
+        len(capabilities.zones),
+    )
 
     # Add input commands dynamically
-    for source in sources:
-        source_uri = source.get("source", "")
-        title = source.get("title", "")
-
-        if not source_uri:
-            continue
-
-        # Create command name from source URI
-        if "hdmi" in source_uri and "port=" in source_uri:
-            # Extract port number from URI like "extInput:hdmi?port=1"
-            port = source_uri.split("port=")[1].split("&")[0]
-            commands.append(f"INPUT_HDMI{port}")
-        elif "tv" in source_uri or source_uri == "extInput:tv":
-            commands.append("INPUT_TV")
-        elif "btAudio" in source_uri:
-            commands.append("INPUT_BLUETOOTH")
-        elif "line" in source_uri:
-            commands.append("INPUT_ANALOG")
-        elif "airPlay" in source_uri:
-            commands.append("INPUT_AIRPLAY")
-        elif "usb" in source_uri:
-            commands.append("INPUT_USB")
-        elif source_uri.startswith("extInput:"):
-            # Handle labeled inputs like game, bd-dvd, sat-catv, mediaBox, etc.
-            # Extract the name after "extInput:" and convert to command format
-            input_name = source_uri.split("extInput:")[1].split("?")[0]
-            # Convert to uppercase and replace hyphens/special chars with underscores
-            command_name = input_name.upper().replace("-", "_").replace(" ", "_")
-            commands.append(f"INPUT_{command_name}")
+    commands.extend(source.cmd for source in sources)
 
     # Add settings refresh command
     commands.append("REFRESH_SETTINGS")
@@ -193,7 +376,7 @@ def create_simple_commands(sources: list[dict[str, Any]], settings_cache: Device
     return commands
 
 
-def create_button_mappings(sources: list[dict[str, Any]]) -> list[Any]:
+def create_button_mappings(sources: list[_SourceInfo]) -> list[Any]:
     """
     Create button mappings for physical remote buttons.
 
@@ -207,37 +390,20 @@ def create_button_mappings(sources: list[dict[str, Any]]) -> list[Any]:
     - Back → Previous input
 
     Args:
-        sources: List of input sources for input cycling
+        sources: Classified input sources for input cycling
 
     Returns:
         List of button mapping configurations
     """
-    mappings = [
-        # === Power Control ===
-        create_btn_mapping(Buttons.POWER, "POWER_TOGGLE"),
-        # === Volume Controls ===
-        create_btn_mapping(Buttons.VOLUME_UP, "VOLUME_UP"),
-        create_btn_mapping(Buttons.VOLUME_DOWN, "VOLUME_DOWN"),
-        create_btn_mapping(Buttons.MUTE, "MUTE_TOGGLE"),
-    ]
+    mappings = list(_BASIC_BUTTON_MAPPINGS)
 
     # === Input Selection with Channel Buttons ===
     # Channel up/down to cycle through inputs
     # Get input commands in order
-    input_commands = []
-    for source in sources:
-        source_uri = source.get("source", "")
-        if "hdmi" in source_uri and "port=" in source_uri:
-            port = source_uri.split("port=")[1].split("&")[0]
-            input_commands.append(f"INPUT_HDMI{port}")
-        elif "tv" in source_uri:
-            input_commands.append("INPUT_TV")
-        elif "btAudio" in source_uri:
-            input_commands.append("INPUT_BLUETOOTH")
-        elif "line" in source_uri:
-            input_commands.append("INPUT_ANALOG")
-        elif "airPlay" in source_uri:
-            input_commands.append("INPUT_AIRPLAY")
+    input_commands = [source.cmd for source in sources if source.type in _CYCLED_SOURCE_TYPES]
+    if not input_commands:
+        # No input buttons to map until sources are discovered
+        return mappings
 
     # Map channel buttons to cycle through inputs if we have multiple
     if len(input_commands) >= 2:
@@ -246,50 +412,62 @@ def create_button_mappings(sources: list[dict[str, Any]]) -> list[Any]:
         # Channel down → previous input (or first input)
         mappings.append(create_btn_mapping(Buttons.CHANNEL_DOWN, input_commands[0]))
 
+    # Set for the membership tests below
+    available_inputs = set(input_commands)
+
     # === Quick Access Buttons ===
     # Home button → TV input (most common usage)
-    if "INPUT_TV" in input_commands:
+    if "INPUT_TV" in available_inputs:
         mappings.append(create_btn_mapping(Buttons.HOME, "INPUT_TV"))
 
     # Back button → HDMI 1 (second most common)
-    if "INPUT_HDMI1" in input_commands:
+    if "INPUT_HDMI1" in available_inputs:
         mappings.append(create_btn_mapping(Buttons.BACK, "INPUT_HDMI1"))
 
     # === Dpad Navigation for Inputs ===
     # Use dpad for quick input selection
-    if len(input_commands) >= 1:
-        # Dpad Up → TV
-        if "INPUT_TV" in input_commands:
-            mappings.append(create_btn_mapping(Buttons.DPAD_UP, "INPUT_TV"))
+    # Dpad Up → TV
+    if "INPUT_TV" in available_inputs:
+        mappings.append(create_btn_mapping(Buttons.DPAD_UP, "INPUT_TV"))
 
-        # Dpad Left → HDMI 1
-        if "INPUT_HDMI1" in input_commands:
-            mappings.append(create_btn_mapping(Buttons.DPAD_LEFT, "INPUT_HDMI1"))
+    # Dpad Left → HDMI 1
+    if "INPUT_HDMI1" in available_inputs:
+        mappings.append(create_btn_mapping(Buttons.DPAD_LEFT, "INPUT_HDMI1"))
 
-        # Dpad Right → HDMI 2
-        if "INPUT_HDMI2" in input_commands:
-            mappings.append(create_btn_mapping(Buttons.DPAD_RIGHT, "INPUT_HDMI2"))
+    # Dpad Right → HDMI 2
+    if "INPUT_HDMI2" in available_inputs:
+        mappings.append(create_btn_mapping(Buttons.DPAD_RIGHT, "INPUT_HDMI2"))
 
-        # Dpad Down → Bluetooth
-        if "INPUT_BLUETOOTH" in input_commands:
-            mappings.append(create_btn_mapping(Buttons.DPAD_DOWN, "INPUT_BLUETOOTH"))
+    # Dpad Down → Bluetooth
+    if "INPUT_BLUETOOTH" in available_inputs:
+        mappings.append(create_btn_mapping(Buttons.DPAD_DOWN, "INPUT_BLUETOOTH"))
 
-        # Dpad Center → Toggle mute (easy thumb access)
-        mappings.append(create_btn_mapping(Buttons.DPAD_MIDDLE, "MUTE_TOGGLE"))
+    # Dpad Center → Toggle mute (easy thumb access)
+    mappings.append(create_btn_mapping(Buttons.DPAD_MIDDLE, "MUTE_TOGGLE"))
 
     return mappings
 
 
-def create_ui_pages(
-    sources: list[dict[str, Any]], device_name: str, settings_cache: DeviceSettingsCache
-) -> list[UiPage]:
+@functools.lru_cache(maxsize=1024)
+def _ui_icon(icon: str, x: int, y: int, cmd: str | None = None, size: tuple[int, int] | None = None) -> UiItem:
+    """Create an icon UI item; identical items are shared between pages and devices."""
+    return create_ui_icon(icon, x, y, size=Size(*size) if size else None, cmd=cmd)
+
+
+@functools.lru_cache(maxsize=1024)
+def _ui_text(text: str, x: int, y: int, cmd: str | None = None, size: tuple[int, int] | None = None) -> UiItem:
+    """Create a text UI item; identical items are shared between pages and devices."""
+    return create_ui_text(text, x, y, size=Size(*size) if size else None, cmd=cmd)
+
+
+def create_ui_pages(sources: list[_SourceInfo], device_name: str, capabilities: _DeviceCapabilities) -> list[UiPage]:
     """
     Create UI pages for remote entity (dynamically generated).
 
     Args:
-        sources: List of input sources from get_source_list()
+        sources: Classified input sources from _classify_sources()
         device_name: Name of the device
-        settings_cache: Device settings cache with discovered capabilities
+        capabilities: Device capabilities from _collect_capabilities()
 
     Returns:
         List of UI page objects based on device capabilities
@@ -298,103 +476,49 @@ def create_ui_pages(
 
     # Main control page
     main_page = UiPage("main", "Controls")
-    main_page.add(create_ui_text(device_name, 0, 0, size=Size(4, 1)))
-
-    # Power buttons
-    main_page.add(create_ui_icon("uc:power-on", 0, 1, cmd="POWER_ON"))
-    main_page.add(create_ui_icon("uc:power-off", 1, 1, cmd="POWER_OFF"))
-
-    # Volume controls
-    main_page.add(create_ui_icon("uc:volume-up", 0, 2, cmd="VOLUME_UP"))
-    main_page.add(create_ui_icon("uc:volume-down", 1, 2, cmd="VOLUME_DOWN"))
-    main_page.add(create_ui_icon("uc:mute", 2, 2, cmd="MUTE_TOGGLE"))
+    main_page.add(_ui_text(device_name, 0, 0, size=(4, 1)))
+    main_page.items.extend(_MAIN_PAGE_CONTROLS)
 
     pages.append(main_page)
 
     # Inputs page
     if sources:
         inputs_page = UiPage("inputs", "Inputs")
-        inputs_page.add(create_ui_text("Select Input", 0, 0, size=Size(4, 1)))
+        inputs_page.add(_ui_text("Select Input", 0, 0, size=(4, 1)))
 
         row = 1
         col = 0
 
         for source in sources:
-            source_uri = source.get("source", "")
-            title = source.get("title", "Unknown")
-
-            if not source_uri:
-                continue
-
-            # Determine command and icon
-            cmd = None
-            icon = "uc:input"
-
-            if "hdmi" in source_uri and "port=" in source_uri:
-                port = source_uri.split("port=")[1].split("&")[0]
-                cmd = f"INPUT_HDMI{port}"
-                icon = "uc:hdmi"
-            elif "tv" in source_uri:
-                cmd = "INPUT_TV"
-                icon = "uc:tv"
-            elif "btAudio" in source_uri:
-                cmd = "INPUT_BLUETOOTH"
-                icon = "uc:bluetooth"
-            elif "line" in source_uri:
-                cmd = "INPUT_ANALOG"
-                icon = "uc:line-in"
-            elif "airPlay" in source_uri:
-                cmd = "INPUT_AIRPLAY"
-                icon = "uc:airplay"
-            elif source_uri.startswith("extInput:"):
-                # Handle labeled inputs (game, bd-dvd, mediaBox, etc.)
-                input_name = source_uri.split("extInput:")[1].split("?")[0]
-                command_name = input_name.upper().replace("-", "_").replace(" ", "_")
-                cmd = f"INPUT_{command_name}"
-                # Use appropriate icon based on input name
-                if "game" in input_name.lower():
-                    icon = "uc:gaming"
-                elif "bd" in input_name.lower() or "dvd" in input_name.lower():
-                    icon = "uc:disc"
-                elif "sat" in input_name.lower() or "catv" in input_name.lower() or "cable" in input_name.lower():
-                    icon = "uc:satellite"
-                elif "cd" in input_name.lower():
-                    icon = "uc:music"
-                elif "video" in input_name.lower():
-                    icon = "uc:video"
-                else:
-                    icon = "uc:input"
-
-            if cmd:
-                # Create button with icon and label
-                inputs_page.add(create_ui_icon(icon, col, row, cmd=cmd))
-                inputs_page.add(
-                    create_ui_text(
-                        title[:12],  # Truncate long titles
-                        col,
-                        row + 1,
-                        size=Size(1, 1),
-                        cmd=cmd,
-                    )
+            # Create button with icon and label
+            inputs_page.add(_ui_icon(source.icon, col, row, cmd=source.cmd))
+            inputs_page.add(
+                _ui_text(
+                    source.label,
+                    col,
+                    row + 1,
+                    size=(1, 1),
+                    cmd=source.cmd,
                 )
+            )
 
-                col += 1
-                if col >= 4:
-                    col = 0
-                    row += 2
+            col += 1
+            if col >= 4:
+                col = 0
+                row += 2
 
         pages.append(inputs_page)
 
     # Sound Settings page (only if device supports sound settings)
-    if settings_cache.sound_settings:
+    if capabilities.has_sound_settings:
         sound_page = UiPage("sound", "Sound")
-        sound_page.add(create_ui_text("Sound Settings", 0, 0, size=Size(4, 1)))
+        sound_page.add(_ui_text("Sound Settings", 0, 0, size=(4, 1)))
         current_row = 1
 
         # Dynamically add sound field buttons
-        sound_field_values = settings_cache.get_available_sound_field_values()
+        sound_field_values = capabilities.sound_fields
         if sound_field_values:
-            sound_page.add(create_ui_text("Sound Field", 0, current_row, size=Size(2, 1)))
+            sound_page.add(_ui_text("Sound Field", 0, current_row, size=(2, 1)))
             current_row += 1
 
             col = 0
@@ -407,18 +531,18 @@ def create_ui_pages(
                 elif "dolby" in value.lower() or "dts" in value.lower():
                     icon = "uc:speaker"
 
-                sound_page.add(create_ui_icon(icon, col, current_row, cmd=cmd, size=Size(1, 1)))
+                sound_page.add(_ui_icon(icon, col, current_row, cmd=cmd, size=(1, 1)))
                 # Truncate long titles
-                display_title = title[:8] if len(title) > 8 else title
-                sound_page.add(create_ui_text(display_title, col, current_row + 1, size=Size(1, 1)))
+                display_title = title[:8]
+                sound_page.add(_ui_text(display_title, col, current_row + 1, size=(1, 1)))
                 col += 1
 
             current_row += 2
 
         # Dynamically add boolean/enum settings
-        boolean_settings = settings_cache.get_available_boolean_settings()
+        boolean_settings = capabilities.boolean_settings
         if boolean_settings:
-            sound_page.add(create_ui_text("Settings", 0, current_row, size=Size(2, 1)))
+            sound_page.add(_ui_text("Settings", 0, current_row, size=(2, 1)))
             current_row += 1
 
             col = 0
@@ -427,8 +551,8 @@ def create_ui_pages(
                     cmd = f"SOUND_{target.upper()}_{value.upper()}"
                     # Truncate long titles and add value
                     display_title = f"{title[:6]} {value[:3]}"
-                    sound_page.add(create_ui_icon("uc:settings", col, current_row, cmd=cmd, size=Size(1, 1)))
-                    sound_page.add(create_ui_text(display_title, col, current_row + 1, size=Size(1, 1)))
+                    sound_page.add(_ui_icon("uc:settings", col, current_row, cmd=cmd, size=(1, 1)))
+                    sound_page.add(_ui_text(display_title, col, current_row + 1, size=(1, 1)))
                     col += 1
                     if col >= 4:
                         col = 0
@@ -438,27 +562,25 @@ def create_ui_pages(
         _LOG.info("Created dynamic sound settings page with %d settings", len(boolean_settings))
 
     # Speaker Levels page (only if device supports speaker settings)
-    speaker_controls = settings_cache.get_available_speaker_controls()
+    speaker_controls = capabilities.speaker_controls
     if speaker_controls:
         speaker_page = UiPage("speakers", "Speakers")
-        speaker_page.add(create_ui_text("Speaker Levels", 0, 0, size=Size(4, 1)))
+        speaker_page.add(_ui_text("Speaker Levels", 0, 0, size=(4, 1)))
 
         row = 1
         col = 0
 
         # Dynamically add speaker level controls
         for target, title, min_val, max_val, step in speaker_controls:
-            # Create friendly command name
-            base_name = target.replace("Level", "").replace("level", "")
-            base_cmd = f"SPEAKER_{base_name.upper()}"
+            base_cmd = _speaker_command_base(target)
 
             # Truncate long titles
-            display_title = title[:10] if len(title) > 10 else title
+            display_title = title[:10]
 
             # Add speaker control (takes 2 columns)
-            speaker_page.add(create_ui_text(display_title, col, row, size=Size(2, 1)))
-            speaker_page.add(create_ui_icon("uc:up", col, row + 1, cmd=f"{base_cmd}_UP"))
-            speaker_page.add(create_ui_icon("uc:down", col + 1, row + 1, cmd=f"{base_cmd}_DOWN"))
+            speaker_page.add(_ui_text(display_title, col, row, size=(2, 1)))
+            speaker_page.add(_ui_icon("uc:up", col, row + 1, cmd=base_cmd + "_UP"))
+            speaker_page.add(_ui_icon("uc:down", col + 1, row + 1, cmd=base_cmd + "_DOWN"))
 
             # Move to next position (2 speakers per row)
             col += 2
@@ -470,34 +592,50 @@ def create_ui_pages(
         _LOG.info("Created dynamic speaker levels page with %d speakers", len(speaker_controls))
 
     # Multi-Zone page (only if device supports multiple zones)
-    if len(settings_cache.zones) > 1:
+    if len(capabilities.zones) > 1:
         zones_page = UiPage("zones", "Zones")
-        zones_page.add(create_ui_text("Multi-Zone Control", 0, 0, size=Size(4, 1)))
+        zones_page.add(_ui_text("Multi-Zone Control", 0, 0, size=(4, 1)))
 
         row = 1
 
         # Dynamically add zone controls
-        for zone in settings_cache.zones:
+        for zone in capabilities.zones:
             zone_name = "Main Zone" if zone == 1 else f"Zone {zone}"
-            zones_page.add(create_ui_text(zone_name, 0, row, size=Size(2, 1)))
+            prefix = f"ZONE{zone}"
+            zones_page.add(_ui_text(zone_name, 0, row, size=(2, 1)))
             row += 1
 
             # Volume controls (all zones)
-            zones_page.add(create_ui_icon("uc:volume-up", 0, row, cmd=f"ZONE{zone}_VOLUME_UP"))
-            zones_page.add(create_ui_icon("uc:volume-down", 1, row, cmd=f"ZONE{zone}_VOLUME_DOWN"))
-            zones_page.add(create_ui_icon("uc:mute", 2, row, cmd=f"ZONE{zone}_MUTE_TOGGLE"))
+            zones_page.add(_ui_icon("uc:volume-up", 0, row, cmd=prefix + "_VOLUME_UP"))
+            zones_page.add(_ui_icon("uc:volume-down", 1, row, cmd=prefix + "_VOLUME_DOWN"))
+            zones_page.add(_ui_icon("uc:mute", 2, row, cmd=prefix + "_MUTE_TOGGLE"))
             row += 1
 
             # Power controls (only for non-main zones)
             if zone > 1:
-                zones_page.add(create_ui_icon("uc:power-on", 0, row, cmd=f"ZONE{zone}_ACTIVATE"))
-                zones_page.add(create_ui_icon("uc:power-off", 1, row, cmd=f"ZONE{zone}_DEACTIVATE"))
+                zones_page.add(_ui_icon("uc:power-on", 0, row, cmd=prefix + "_ACTIVATE"))
+                zones_page.add(_ui_icon("uc:power-off", 1, row, cmd=prefix + "_DEACTIVATE"))
                 row += 1
 
         pages.append(zones_page)
-        _LOG.info("Created dynamic zones page with %d zones", len(settings_cache.zones))
+        _LOG.info("Created dynamic zones page with %d zones", len(capabilities.zones))
 
     # System Settings page
+    pages.append(_build_system_page())
+
+    return pages
+
+
+@functools.cache
+def _build_system_page() -> UiPage:
+    """
+    Build the System Settings page, which is the same for every device.
+
+    Built once and shared by all entities; it is not modified afterwards.
+
+    Returns:
+        System Settings UI page
+    """
     system_page = UiPage("system", "System")
     system_page.add(create_ui_text("System Settings", 0, 0, size=Size(4, 1)))
 
@@ -521,13 +659,16 @@ def create_ui_pages(
     system_page.add(create_ui_icon("uc:close", 3, 5, cmd="SYSTEM_HDMI_OUTPUT_OFF"))
     system_page.add(create_ui_text("Off", 3, 6, size=Size(1, 1)))
 
-    pages.append(system_page)
-
-    return pages
+    return system_page
 
 
 async def create_remote_entity(
-    device: SonyAudioDevice, entity_id: str, cmd_handler, settings_cache: DeviceSettingsCache
+    device: SonyAudioDevice,
+    entity_id: str,
+    cmd_handler,
+    settings_cache: DeviceSettingsCache,
+    sources: list[dict[str, Any]] | None = None,
+    info: dict[str, Any] | None = None,
 ) -> ucapi.Remote:
     """
     Create a remote entity for a Sony Audio device.
@@ -537,31 +678,47 @@ async def create_remote_entity(
         entity_id: Entity identifier
         cmd_handler: Command handler function
         settings_cache: Device settings cache with discovered capabilities
+        sources: Already discovered sources (discovered from the device if None)
+        info: Known device info with at least "model" (fetched from the device if None)
 
     Returns:
         Remote entity instance
     """
     try:
-        # Get device info
-        info = await device.get_device_info()
+        # Get device info and discover all available sources (generic and labeled inputs);
+        # whatever isn't known yet is fetched together, as the queries are independent
+        need_info = not info or "model" not in info
+        if need_info and sources is None:
+            info, sources = await asyncio.gather(device.get_device_info(), discover_all_sources(device))
+        elif need_info:
+            info = await device.get_device_info()
+        elif sources is None:
+            sources = await discover_all_sources(device)
         device_name = info.get("model", "Sony Audio")
 
-        # Discover all available sources (generic and labeled inputs)
-        sources = await discover_all_sources(device)
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info(
+                "Total discovered sources: %d%s",
+                len(sources),
+                "".join(
+                    f"\n  [{idx}] {source.get('title', 'N/A')} → {source.get('source', 'N/A')}"
+                    for idx, source in enumerate(sources, 1)
+                ),
+            )
 
-        _LOG.info("Total discovered sources: %d", len(sources))
-        for idx, source in enumerate(sources):
-            _LOG.info("  [%d] %s → %s", idx + 1, source.get("title", "N/A"), source.get("source", "N/A"))
+        # Derive input commands and icons, and read the settings lists, once for all builders
+        source_infos = _classify_sources(sources)
+        capabilities = _collect_capabilities(settings_cache)
 
         # Create simple commands list dynamically from device capabilities
-        simple_commands = create_simple_commands(sources, settings_cache)
+        simple_commands = create_simple_commands(source_infos, capabilities)
         _LOG.info("Created %d simple commands", len(simple_commands))
 
         # Create button mappings with input sources
-        button_mapping = create_button_mappings(sources)
+        button_mapping = create_button_mappings(source_infos)
 
         # Create UI pages dynamically from device capabilities
-        ui_pages = create_ui_pages(sources, device_name, settings_cache)
+        ui_pages = create_ui_pages(source_infos, device_name, capabilities)
 
         # Create remote entity
         entity = ucapi.Remote(
@@ -587,6 +744,8 @@ def get_input_uri_from_command(command: str, sources: list[dict[str, Any]]) -> s
     """
     Get input source URI from command string.
 
+    Prefer a map from build_input_command_map() when resolving repeatedly.
+
     Args:
         command: Command string (e.g., "INPUT_HDMI1", "INPUT_GAME", "INPUT_BD_DVD")
         sources: List of input sources
@@ -594,30 +753,6 @@ def get_input_uri_from_command(command: str, sources: list[dict[str, Any]]) -> s
     Returns:
         Source URI or None if not found
     """
-    # Map command to source
-    for source in sources:
-        source_uri = source.get("source", "")
-
-        if command == "INPUT_TV" and "tv" in source_uri:
-            return source_uri
-        elif command.startswith("INPUT_HDMI") and "hdmi" in source_uri and "port=" in source_uri:
-            # Extract port number from command
-            port = command.replace("INPUT_HDMI", "")
-            if f"port={port}" in source_uri:
-                return source_uri
-        elif command == "INPUT_BLUETOOTH" and "btAudio" in source_uri:
-            return source_uri
-        elif command == "INPUT_ANALOG" and "line" in source_uri:
-            return source_uri
-        elif command == "INPUT_AIRPLAY" and "airPlay" in source_uri:
-            return source_uri
-        elif command == "INPUT_USB" and "usb" in source_uri:
-            return source_uri
-        elif command.startswith("INPUT_") and source_uri.startswith("extInput:"):
-            # Handle labeled inputs (GAME, BD_DVD, SAT_CATV, etc.)
-            # Convert command like "INPUT_BD_DVD" back to "bd-dvd"
-            input_name = command.replace("INPUT_", "").replace("_", "-").lower()
-            if source_uri == f"extInput:{input_name}":
-                return source_uri
-
-    return None
+    if not sources or not command.startswith("INPUT_"):
+        return None
+    return build_input_command_map(sources).get(command)
@@ -5,18 +5,39 @@ Discovers and caches device capabilities dynamically from the Sony API,
 eliminating hardcoded settings and enabling support for any Sony audio device.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Any, Optional
 
-from sony_client import SonyAudioDevice
+from sony_client import SonyAudioDevice, zone_uri
 
 _LOG = logging.getLogger(__name__)
 
+# Setting types offered as toggle/choice commands
+TOGGLE_SETTING_TYPES = frozenset({"booleanTarget", "enumTarget"})
+
 
 class DeviceSettingsCache:
     """Cache for dynamically discovered device settings."""
 
+    __slots__ = (
+        "device",
+        "sound_settings",
+        "speaker_settings",
+        "zones",
+        "_speaker_index",
+        "_settings_by_target",
+        "_valid_values",
+        "_sound_field_values",
+        "_boolean_settings",
+        "_speaker_controls",
+        "last_refresh",
+        "_refreshed_at",
+        "_refresh_task",
+    )
+
     def __init__(self, device: SonyAudioDevice):
         """
         Initialize settings cache for a device.
@@ -28,9 +49,20 @@ class DeviceSettingsCache:
         self.sound_settings: list[dict[str, Any]] = []
         self.speaker_settings: list[dict[str, Any]] = []
         self.zones: list[int] = []
+        # Speaker controls keyed by command name (e.g. "CENTER" for "centerLevel")
+        self._speaker_index: dict[str, tuple[str, float, float, float]] = {}
+        # Settings and their candidate values keyed by target
+        self._settings_by_target: dict[str, dict[str, Any]] = {}
+        self._valid_values: dict[str, frozenset[str]] = {}
+        # Available settings derived at refresh time for the get_available_*() getters
+        self._sound_field_values: list[tuple[str, str]] = []
+        self._boolean_settings: list[tuple[str, str, list[str]]] = []
+        self._speaker_controls: list[tuple[str, str, float, float, float]] = []
         self.last_refresh: Optional[datetime] = None
+        self._refreshed_at: Optional[float] = None  # time.monotonic() of the last refresh, for age checks
+        self._refresh_task: Optional[asyncio.Task] = None
 
-    async def refresh(self) -> None:
+    async def refresh(self, max_age: Optional[float] = None) -> None:
         """
         Discover and cache all device capabilities.
 
@@ -38,23 +70,51 @@ class DeviceSettingsCache:
         - Sound settings (sound fields, 360SSM, calibration, dimmer, HDMI output)
         - Speaker settings (which speakers exist and their adjustment ranges)
         - Available zones for multi-zone audio
+
+        Callers arriving while a refresh is running wait for that refresh
+        instead of starting another one.
+
+        Args:
+            max_age: Skip the refresh if the cache is at most this many seconds old
+                     (default: always refresh)
         """
+        if self._refresh_task is None or self._refresh_task.done():
+            if max_age is not None and not self.is_stale(max_age):
+                return
+            self._refresh_task = asyncio.create_task(self._refresh())
+        # Shielded so one cancelled caller does not abort the refresh for the others
+        await asyncio.shield(self._refresh_task)
+
+    async def _refresh(self) -> None:
+        """Query the device and replace the cached capabilities."""
         _LOG.info("Refreshing device settings cache...")
 
         try:
-            # Discover sound settings
-            self.sound_settings = await self.device.get_sound_settings(target="")
-            _LOG.info("Discovered %d sound settings", len(self.sound_settings))
-
-            # Discover speaker settings
-            self.speaker_settings = await self.device.get_speaker_settings(target="")
-            _LOG.info("Discovered %d speaker settings", len(self.speaker_settings))
-
-            # Discover available zones
-            self.zones = await self._discover_zones()
-            _LOG.info("Discovered %d zones", len(self.zones))
+            # Discover sound settings, speaker settings and available zones; the queries are independent
+            sound_settings, speaker_settings, zones = await asyncio.gather(
+                self.device.get_sound_settings(target=""),
+                self.device.get_speaker_settings(target=""),
+                self._discover_zones(),
+            )
+            _LOG.info(
+                "Discovered %d sound settings, %d speaker settings and %d zones",
+                len(sound_settings),
+                len(speaker_settings),
+                len(zones),
+            )
+
+            # Copied, as set_cached_value() updates them and responses may be shared with other callers
+            self.sound_settings = [dict(setting) for setting in sound_settings]
+            self.speaker_settings = [dict(setting) for setting in speaker_settings]
+            self.zones = zones
+            self._index_settings()
+            self._speaker_index = {
+                target.replace("Level", "").replace("level", "").upper(): (target, min_val, max_val, step)
+                for target, _, min_val, max_val, step in self._speaker_controls
+            }
 
             self.last_refresh = datetime.now()
+            self._refreshed_at = time.monotonic()
             _LOG.info("Settings cache refresh complete")
 
         except Exception as e:
@@ -62,6 +122,38 @@ class DeviceSettingsCache:
             # Keep existing cache if refresh fails
             raise
 
+    def _index_settings(self) -> None:
+        """
+        Index the discovered settings and derive the available settings lists.
+
+        Sound settings win over speaker settings with the same target.
+        """
+        by_target: dict[str, dict[str, Any]] = {}
+        for setting in self.sound_settings + self.speaker_settings:
+            by_target.setdefault(setting.get("target"), setting)
+        self._settings_by_target = by_target
+        self._valid_values = {
+            target: frozenset(c.get("value") for c in setting.get("candidate", []))
+            for target, setting in by_target.items()
+        }
+        self._sound_field_values = self._find_sound_field_values()
+        self._boolean_settings = self._find_boolean_settings()
+        self._speaker_controls = self._find_speaker_controls()
+
+    def is_stale(self, max_age: float) -> bool:
+        """
+        Check whether the cache is older than a given age.
+
+        Args:
+            max_age: Maximum age in seconds
+
+        Returns:
+            True if the cache was never refreshed or was refreshed longer ago than max_age
+        """
+        if self._refreshed_at is None:
+            return True
+        return time.monotonic() - self._refreshed_at > max_age
+
     async def _discover_zones(self) -> list[int]:
         """
         Discover available audio zones.
@@ -71,16 +163,18 @@ class DeviceSettingsCache:
         """
         zones = [1]  # Main zone always exists
 
-        # Try to get volume info for zones 2 and 3
-        for zone_num in [2, 3]:
-            try:
-                zone_uri = f"extOutput:zone?zone={zone_num}"
-                vol_info = await self.device.get_volume_info(zone_uri)
-                if vol_info and len(vol_info) > 0:
-                    zones.append(zone_num)
-                    _LOG.debug("Zone %d is available", zone_num)
-            except Exception as e:
-                _LOG.debug("Zone %d not available: %s", zone_num, e)
+        # Try to get volume info for zones 2 and 3; probe both at once so absent zones time out together
+        candidates = (2, 3)
+        results = await asyncio.gather(
+            *(self.device.get_volume_info(zone_uri(zone_num)) for zone_num in candidates),
+            return_exceptions=True,
+        )
+        for zone_num, vol_info in zip(candidates, results):
+            if isinstance(vol_info, BaseException):
+                _LOG.debug("Zone %d not available: %s", zone_num, vol_info)
+            elif vol_info:
+                zones.append(zone_num)
+                _LOG.debug("Zone %d is available", zone_num)
 
         return zones
 
@@ -94,17 +188,7 @@ class DeviceSettingsCache:
         Returns:
             Setting dictionary or None if not found
         """
-        # Search in sound settings
-        for setting in self.sound_settings:
-            if setting.get("target") == target:
-                return setting
-
-        # Search in speaker settings
-        for setting in self.speaker_settings:
-            if setting.get("target") == target:
-                return setting
-
-        return None
+        return self._settings_by_target.get(target)
 
     def get_available_sound_field_values(self) -> list[tuple[str, str]]:
         """
@@ -113,6 +197,10 @@ class DeviceSettingsCache:
         Returns:
             List of (value, title) tuples for each available sound field
         """
+        return self._sound_field_values
+
+    def _find_sound_field_values(self) -> list[tuple[str, str]]:
+        """Collect the available sound field modes from the discovered settings."""
         sound_field = self.get_setting_by_target("soundField")
         if not sound_field:
             return []
@@ -133,9 +221,13 @@ class DeviceSettingsCache:
         Returns:
             List of (target, title, values) tuples for toggle settings
         """
+        return self._boolean_settings
+
+    def _find_boolean_settings(self) -> list[tuple[str, str, list[str]]]:
+        """Collect the available boolean/enum settings from the discovered settings."""
         settings = []
         for setting in self.sound_settings:
-            if setting.get("type") in ["booleanTarget", "enumTarget"]:
+            if setting.get("type") in TOGGLE_SETTING_TYPES:
                 if not setting.get("isAvailable", True):
                     continue
 
@@ -154,6 +246,10 @@ class DeviceSettingsCache:
         Returns:
             List of (target, title, min, max, step) tuples for each adjustable speaker
         """
+        return self._speaker_controls
+
+    def _find_speaker_controls(self) -> list[tuple[str, str, float, float, float]]:
+        """Collect the adjustable speaker level controls from the discovered settings."""
         speakers = []
         for setting in self.speaker_settings:
             if setting.get("type") != "doubleNumberTarget":
@@ -174,6 +270,18 @@ class DeviceSettingsCache:
 
         return speakers
 
+    def get_speaker_control(self, name: str) -> Optional[tuple[str, float, float, float]]:
+        """
+        Find a speaker level control by its command name.
+
+        Args:
+            name: Speaker name as used in commands (e.g., "CENTER", "SUBWOOFER")
+
+        Returns:
+            (target, min, max, step) tuple, or None if the device has no such control
+        """
+        return self._speaker_index.get(name)
+
     def get_current_value(self, target: str) -> Optional[str]:
         """
         Get current value for a setting.
@@ -189,6 +297,18 @@ class DeviceSettingsCache:
             return setting.get("currentValue")
         return None
 
+    def set_cached_value(self, target: str, value: str) -> None:
+        """
+        Update the cached current value of a setting after changing it on the device.
+
+        Args:
+            target: Setting target identifier
+            value: New value as string
+        """
+        setting = self.get_setting_by_target(target)
+        if setting is not None:
+            setting["currentValue"] = value
+
     def is_setting_available(self, target: str) -> bool:
         """
         Check if a setting is available on this device.
@@ -215,12 +335,5 @@ class DeviceSettingsCache:
         Returns:
             True if value is valid for this setting
         """
-        setting = self.get_setting_by_target(target)
-        if not setting:
-            return False
-
-        candidates = setting.get("candidate", [])
-        valid_values = [c.get("value") for c in candidates]
-
-        return value in valid_values
+        return value in self._valid_values.get(target, ())
 
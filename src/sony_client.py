@@ -4,41 +4,213 @@ Sony Audio Control API Client.
 Async wrapper for Sony Audio Control API supporting TA-AN1000 and similar devices.
 """
 
+import asyncio
+import functools
+import json
 import logging
+import random
+import time
+from collections.abc import Callable
 from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - the stdlib is only slower on these small payloads
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
 _LOG = logging.getLogger(__name__)
 
+# Request headers of the JSON-RPC calls; bodies are serialized before posting
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Params of calls without parameters; only ever serialized, never mutated
+_EMPTY_PARAMS: list = []
+
+# Params item of output queries covering all outputs; only ever serialized, never mutated
+_EMPTY_OUTPUT: dict = {}
+
+# Seconds a fetched power status is reused
+POWER_STATUS_TTL = 2.0
+
+# Seconds cached device metadata (source list, versions, ...) is reused before asking again
+METADATA_TTL = 300.0
+
+# Timeout of a single API request; ClientTimeout is immutable, so one instance serves every call
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=3)
+
+# Retries of a request after a transient failure, and the cap of the randomized delay before each (seconds)
+MAX_RETRIES = 2
+RETRY_MAX_DELAY = 1.0
+
+# Consecutive failed requests after which a device is considered unreachable, and for how long (seconds)
+UNREACHABLE_THRESHOLD = 5
+UNREACHABLE_COOLDOWN = 10.0
+
+# Failures that cannot have reached the device, so any request may be sent again
+_UNSENT_ERRORS = (aiohttp.ClientConnectorError,)
+
+# Failures after which a read request may be sent again
+_TRANSIENT_ERRORS = (asyncio.TimeoutError, aiohttp.ClientConnectorError, aiohttp.ServerDisconnectedError)
+
+# API requests in flight per device; further calls wait so the device's small HTTP server isn't flooded
+MAX_CONCURRENT_REQUESTS = 4
+
+# Services of the Audio Control API, each served at <base_url>/<service>; "guide" lists the others
+API_SERVICES = ("guide", "system", "audio", "avContent")
+
+# HTTP session shared by device clients that are given it
+_SHARED_SESSION: aiohttp.ClientSession | None = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """
+    Create an HTTP session tuned for talking to Sony devices.
+
+    Keeps idle connections open between polls, asking the devices' embedded
+    servers to do so too; the devices set no cookies, so responses skip cookie
+    jar processing, and the tiny JSON responses aren't worth compressing.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75),
+        cookie_jar=aiohttp.DummyCookieJar(),
+        headers={"Connection": "keep-alive"},
+        skip_auto_headers=("Accept-Encoding",),
+    )
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the HTTP session shared across devices, creating it if needed.
+
+    Keeps connections to the devices alive between the many small API calls.
+    Must be called from within the running event loop.
+    """
+    global _SHARED_SESSION  # pylint: disable=global-statement
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed:
+        _SHARED_SESSION = _create_session()
+    return _SHARED_SESSION
+
+
+async def close_shared_session() -> None:
+    """Close the HTTP session shared across devices."""
+    global _SHARED_SESSION  # pylint: disable=global-statement
+    if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+        await _SHARED_SESSION.close()
+    _SHARED_SESSION = None
+
+
+@functools.cache
+def zone_uri(zone: int) -> str:
+    """Get the output URI of a zone (e.g., 2 -> "extOutput:zone?zone=2")."""
+    return f"extOutput:zone?zone={zone}"
+
+
+@functools.lru_cache(maxsize=32)
+def _output_query_body(method: str, version: str, output: str) -> bytes:
+    """
+    Serialize a request querying an output, e.g. its volume or playing content.
+
+    These are polled with the same few outputs, so their request bodies are
+    serialized once and reused.
+    """
+    params = [{"output": output} if output else _EMPTY_OUTPUT]
+    return _json_dumps({"method": method, "id": 1, "params": params, "version": version})
+
+
+@functools.lru_cache(maxsize=64)
+def _output_setting_body(method: str, version: str, output: str, name: str, value: str) -> bytes:
+    """
+    Serialize a request setting one value of an output, e.g. its volume or mute.
+
+    Remotes send the same few volume steps and mute changes over and over, so
+    their request bodies are serialized once and reused.
+    """
+    return _json_dumps({"method": method, "id": 1, "params": [{"output": output, name: value}], "version": version})
+
 
 class SonyAudioDevice:
     """Sony Audio Control API client."""
 
-    def __init__(self, ip_address: str, port: int = 10000):
+    __slots__ = (
+        "ip_address",
+        "port",
+        "base_url",
+        "_service_urls",
+        "_session",
+        "_owns_session",
+        "_device_info",
+        "_metadata",
+        "_power_status",
+        "_power_generation",
+        "_request_slots",
+        "_inflight",
+        "_failures",
+        "_failed_at",
+    )
+
+    def __init__(self, ip_address: str, port: int = 10000, session: aiohttp.ClientSession | None = None):
         """
         Initialize Sony Audio Device client.
 
         Args:
             ip_address: IP address of the Sony device
             port: API port (default: 10000)
+            session: Shared HTTP session to use; it is not closed by this client
         """
         self.ip_address = ip_address
         self.port = port
         self.base_url = f"http://{ip_address}:{port}/sony"
-        self._session: aiohttp.ClientSession | None = None
+        self._service_urls = {service: f"{self.base_url}/{service}" for service in API_SERVICES}
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
         self._device_info: dict[str, Any] | None = None
+        # Requests for rarely changing metadata with their start time, by (kind, *params)
+        self._metadata: dict[tuple, tuple[float, asyncio.Future]] = {}
+        self._power_status: tuple[float, str] | None = None  # (time.monotonic(), status)
+        # Bumped when setting the power status, so a status read before the change is not cached
+        self._power_generation = 0
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Read requests being sent, by (url, body), so identical concurrent reads share one
+        self._inflight: dict[tuple[str, bytes], asyncio.Future] = {}
+        self._failures = 0  # Consecutive failed requests
+        self._failed_at = 0.0  # time.monotonic() of the last failed request
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Ensure HTTP session exists.
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure HTTP session exists."""
+        Deliberately not a coroutine: without an await between the check and
+        the assignment, concurrent calls can't each create a session.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = _create_session()
+            self._owns_session = True
         return self._session
 
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the HTTP session if this client created it."""
+        if self._owns_session and self._session:
+            session, self._session = self._session, None
+            if not session.closed:
+                await session.close()
+
+    async def __aenter__(self) -> "SonyAudioDevice":
+        """Open the HTTP session; it is closed again on exit if this client created it."""
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the HTTP session if this client created it."""
+        await self.close()
 
     async def _call(
         self,
@@ -47,7 +219,9 @@ class SonyAudioDevice:
         params: list | None = None,
         version: str = "1.0",
         req_id: int = 1,
-        timeout: int = 3,
+        timeout: aiohttp.ClientTimeout = REQUEST_TIMEOUT,
+        body: bytes | None = None,
+        expect_result: bool = True,
     ) -> dict[str, Any]:
         """
         Make a JSON-RPC call to the Sony Audio Control API.
@@ -58,45 +232,202 @@ class SonyAudioDevice:
             params: Method parameters
             version: API version
             req_id: Request ID
-            timeout: Request timeout in seconds
+            timeout: Request timeout (default: 3 seconds total)
+            body: Already serialized request to send instead of one built from the arguments
+            expect_result: Whether the caller uses the result; if not, successful responses
+                           are not parsed and an empty dictionary is returned
 
         Returns:
-            API response as dictionary
+            API response as dictionary; concurrent identical reads get the same
+            object, so callers must copy what they modify
+
+        Transient failures are retried with a randomized backoff: read requests
+        (get*) after timeouts, dropped connections and server errors (5xx), others
+        only when the connection could not be made, so a change is never applied
+        twice. After UNREACHABLE_THRESHOLD calls in a row failed without an answer
+        from the device, calls fail immediately for UNREACHABLE_COOLDOWN seconds
+        instead of waiting for the device to time out.
+
+        Concurrent identical read requests are sent once and share the response.
 
         Raises:
             aiohttp.ClientError: On connection errors
+            DeviceUnreachableError: While the device is considered unreachable
+            asyncio.TimeoutError: If the device doesn't answer in time
             SonyApiError: On API errors
         """
-        url = f"{self.base_url}/{service}"
-        payload = {
-            "method": method,
-            "id": req_id,
-            "params": params or [],
-            "version": version,
-        }
+        if self._failures >= UNREACHABLE_THRESHOLD and time.monotonic() - self._failed_at < UNREACHABLE_COOLDOWN:
+            raise DeviceUnreachableError(f"{self.ip_address} is unreachable, not calling {service}.{method}")
+
+        url = self._service_urls.get(service) or f"{self.base_url}/{service}"
+        if body is None:
+            body = _json_dumps(
+                {
+                    "method": method,
+                    "id": req_id,
+                    "params": params if params is not None else _EMPTY_PARAMS,
+                    "version": version,
+                }
+            )
+
+        if not method.startswith("get"):
+            return await self._send(service, method, url, body, timeout, expect_result, read=False)
+
+        key = (url, body)
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._send(service, method, url, body, timeout, expect_result, read=True))
+            self._inflight[key] = request
+            request.add_done_callback(functools.partial(self._forget_inflight, key))
+        # Shielded so one cancelled caller does not abort the request for the others
+        return await asyncio.shield(request)
+
+    def _forget_inflight(self, key: tuple[str, bytes], request: asyncio.Future) -> None:
+        """Drop a finished read request from the in-flight requests."""
+        if self._inflight.get(key) is request:
+            del self._inflight[key]
+        # Mark a failure as retrieved, as all callers waiting for it may have been cancelled
+        if not request.cancelled():
+            request.exception()
+
+    async def _send(
+        self,
+        service: str,
+        method: str,
+        url: str,
+        body: bytes,
+        timeout: aiohttp.ClientTimeout,
+        expect_result: bool,
+        read: bool,
+    ) -> dict[str, Any]:
+        """
+        Post a request for _call(), retrying it after transient failures and tracking reachability.
+
+        HTTP error responses come from a device that is reachable, so they don't
+        count towards UNREACHABLE_THRESHOLD; reads are retried after server errors (5xx).
+        """
+        retry_on = _TRANSIENT_ERRORS if read else _UNSENT_ERRORS
+        attempt = 0
+        while True:
+            try:
+                data = await self._post(url, body, method, timeout, expect_result)
+            except retry_on as e:
+                if attempt >= MAX_RETRIES:
+                    self._record_failure(service, method, e)
+                    raise
+            except aiohttp.ClientResponseError as e:
+                self._failures = 0
+                if not read or e.status < 500 or attempt >= MAX_RETRIES:
+                    _LOG.error("HTTP error %d calling %s.%s: %s", e.status, service, method, e.message)
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._record_failure(service, method, e)
+                raise
+            except SonyApiError:
+                # The device answered, it just refused the request
+                self._failures = 0
+                raise
+            else:
+                self._failures = 0
+                return data
+            # Full jitter keeps clients of a device that just came back from retrying in lockstep
+            await asyncio.sleep(random.uniform(0, min(RETRY_MAX_DELAY, 0.1 * 2**attempt)))
+            attempt += 1
+
+    def _record_failure(self, service: str, method: str, error: BaseException) -> None:
+        """Count a failed call towards considering the device unreachable."""
+        # Fires on every poll while a device is down, so only describe the error when it is logged
+        if _LOG.isEnabledFor(logging.ERROR):
+            _LOG.error("Connection error calling %s.%s: %s", service, method, str(error) or type(error).__name__)
+        self._failures += 1
+        self._failed_at = time.monotonic()
+
+    async def _post(
+        self, url: str, body: bytes, method: str, timeout: aiohttp.ClientTimeout, expect_result: bool = True
+    ) -> dict[str, Any]:
+        """
+        Post one serialized JSON-RPC request and return the parsed response.
 
-        session = await self._ensure_session()
-        try:
-            async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        Setters don't use the result, so unless expect_result is set, responses
+        without an error are not parsed and an empty dictionary is returned.
+
+        Raises:
+            aiohttp.ClientError: On connection and HTTP errors
+            SonyApiError: On API errors
+        """
+        session = self._ensure_session()
+        async with (
+            self._request_slots,
+            session.post(url, data=body, headers=_JSON_HEADERS, timeout=timeout) as response,
+        ):
+            if response.status >= 400:
                 response.raise_for_status()
-                # Sony devices sometimes don't set correct content-type, force JSON parsing
-                data = await response.json(content_type=None)
-
-                if "error" in data:
-                    error_code = data["error"][0] if data["error"] else "unknown"
-                    error_msg = data["error"][1] if len(data["error"]) > 1 else ""
-                    _LOG.warning(
-                        "Sony API error: code=%s, msg=%s, method=%s",
-                        error_code,
-                        error_msg,
-                        method,
-                    )
-                    raise SonyApiError(error_code, error_msg, method)
+            raw = await response.read()
 
-                return data
-        except aiohttp.ClientError as e:
-            _LOG.error("Connection error calling %s.%s: %s", service, method, e)
-            raise
+        if not expect_result and b'"error"' not in raw:
+            return {}
+        # Sony devices sometimes don't set correct content-type, so parse the body as JSON regardless
+        data = _json_loads(raw)
+
+        error = data.get("error")
+        if error is not None:
+            error_code = error[0] if error else "unknown"
+            error_msg = error[1] if len(error) > 1 else ""
+            _LOG.warning(
+                "Sony API error: code=%s, msg=%s, method=%s",
+                error_code,
+                error_msg,
+                method,
+            )
+            raise SonyApiError(error_code, error_msg, method)
+
+        return data
+
+    async def _call_cached(self, service: str, method: str, params: list, version: str, key: tuple) -> Any:
+        """
+        Make a JSON-RPC call for rarely changing metadata and reuse its first result.
+
+        Results are reused for METADATA_TTL seconds. Concurrent callers share the
+        request in flight. Failed requests are not cached, so the next caller
+        tries again.
+
+        Args:
+            service: Service name (system, audio, avContent)
+            method: Method name
+            params: Method parameters
+            version: API version
+            key: Cache key identifying the method and its parameters
+
+        Returns:
+            First element of the response's result
+        """
+        now = time.monotonic()
+        started, request = self._metadata.get(key, (0.0, None))
+        if (
+            request is None
+            or now - started > METADATA_TTL
+            or (request.done() and (request.cancelled() or request.exception()))
+        ):
+            request = asyncio.ensure_future(self._call(service, method, params, version))
+            self._metadata[key] = (now, request)
+        # Shielded so one cancelled caller does not abort the request for the others
+        result = await asyncio.shield(request)
+        return result["result"][0]
+
+    def _invalidate_cache(self, kind: str | None = None) -> None:
+        """
+        Forget cached metadata so the next calls query the device again.
+
+        Args:
+            kind: Only forget this kind of metadata ("interface", "versions", "schemes"
+                  or "sources"); forget everything, including device information, if None
+        """
+        if kind is None:
+            self._device_info = None
+            self._metadata.clear()
+            return
+        for key in [key for key in self._metadata if key[0] == kind]:
+            del self._metadata[key]
 
     async def connect(self) -> bool:
         """
@@ -106,12 +437,67 @@ class SonyAudioDevice:
             True if device is reachable and responds correctly
         """
         try:
-            info = await self.get_device_info()
+            # Prefetch alongside, as setting up the entity follows a successful connect
+            info, _ = await asyncio.gather(self.get_device_info(), self._warm_up())
             return info is not None
         except Exception as e:
             _LOG.error("Failed to connect to device at %s: %s", self.ip_address, e)
             return False
 
+    async def _warm_up(self) -> None:
+        """
+        Prefetch cached metadata needed to set up the device's entity.
+
+        Fills the metadata cache with the input source list so building the
+        entity right after connecting doesn't wait for it. Failures are ignored;
+        the data is fetched again when it is actually needed.
+        """
+        try:
+            await self.get_source_list("extInput")
+        except Exception as e:
+            _LOG.debug("Could not prefetch source list from %s: %s", self.ip_address, e)
+
+    async def listen_notifications(
+        self, service: str, notifications: list[str], callback: Callable[[str, dict[str, Any]], None]
+    ) -> None:
+        """
+        Enable notifications of a service and deliver them until the connection closes.
+
+        Opens the service's WebSocket endpoint and sends switchNotifications for
+        the requested names. Returns when the device closes the connection.
+
+        Args:
+            service: Service name (system, audio, avContent)
+            notifications: Notification names to enable (e.g., "notifyPowerStatus")
+            callback: Called with the notification name and its first parameter
+
+        Raises:
+            aiohttp.ClientError: On connection errors
+        """
+        session = self._ensure_session()
+        url = f"ws://{self.ip_address}:{self.port}/sony/{service}"
+        async with session.ws_connect(url) as ws:
+            await ws.send_json(
+                {
+                    "method": "switchNotifications",
+                    "id": 1,
+                    "params": [{"enabled": [{"name": name, "version": "1.0"} for name in notifications]}],
+                    "version": "1.0",
+                }
+            )
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.ERROR:
+                    break
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+
+                data = _json_loads(msg.data)
+                method = data.get("method")
+                if method in notifications and data.get("params"):
+                    callback(method, data["params"][0])
+                elif "error" in data:
+                    _LOG.warning("Sony API error enabling %s notifications: %s", service, data["error"])
+
     # System Service Methods
 
     async def get_device_info(self) -> dict[str, Any]:
@@ -123,8 +509,7 @@ class SonyAudioDevice:
 
     async def get_interface_info(self) -> dict[str, Any]:
         """Get interface version and product information."""
-        result = await self._call("system", "getInterfaceInformation", [], "1.0")
-        return result["result"][0]
+        return await self._call_cached("system", "getInterfaceInformation", [], "1.0", ("interface",))
 
     async def get_power_status(self) -> str:
         """
@@ -133,8 +518,17 @@ class SonyAudioDevice:
         Returns:
             "active" or "standby"
         """
+        # Setup, subscription and polling often ask within moments of each other
+        now = time.monotonic()
+        if self._power_status and now - self._power_status[0] < POWER_STATUS_TTL:
+            return self._power_status[1]
+
+        generation = self._power_generation
         result = await self._call("system", "getPowerStatus", [], "1.1")
-        return result["result"][0]["status"]
+        status = result["result"][0]["status"]
+        if generation == self._power_generation:
+            self._power_status = (now, status)
+        return status
 
     async def set_power_status(self, status: str) -> None:
         """
@@ -143,7 +537,14 @@ class SonyAudioDevice:
         Args:
             status: "active" or "standby"
         """
-        await self._call("system", "setPowerStatus", [{"status": status}], "1.1")
+        self._power_status = None
+        self._power_generation += 1
+        try:
+            await self._call("system", "setPowerStatus", [{"status": status}], "1.1", expect_result=False)
+        finally:
+            # A status read while the change was being sent may be from before it
+            self._power_status = None
+            self._power_generation += 1
 
     async def get_versions(self, service: str) -> list[str]:
         """
@@ -155,8 +556,7 @@ class SonyAudioDevice:
         Returns:
             List of supported version strings
         """
-        result = await self._call(service, "getVersions", [], "1.0")
-        return result["result"][0]
+        return await self._call_cached(service, "getVersions", [], "1.0", ("versions", service))
 
     # Audio Service Methods
 
@@ -170,11 +570,8 @@ class SonyAudioDevice:
         Returns:
             List of volume info dictionaries
         """
-        if zone:
-            params = [{"output": zone}]
-        else:
-            params = [{}]
-        result = await self._call("audio", "getVolumeInformation", params, "1.1")
+        body = _output_query_body("getVolumeInformation", "1.1", zone)
+        result = await self._call("audio", "getVolumeInformation", body=body)
         return result["result"][0]
 
     async def set_volume(self, volume: int | str, zone: str = "") -> None:
@@ -185,8 +582,8 @@ class SonyAudioDevice:
             volume: Absolute level (e.g., 25) or relative ("+1", "-2")
             zone: Zone identifier (default "" for main zone)
         """
-        params = [{"output": zone, "volume": str(volume)}]
-        await self._call("audio", "setAudioVolume", params, "1.1")
+        body = _output_setting_body("setAudioVolume", "1.1", zone, "volume", str(volume))
+        await self._call("audio", "setAudioVolume", body=body, expect_result=False)
 
     async def set_mute(self, mute: bool, zone: str = "") -> None:
         """
@@ -197,8 +594,8 @@ class SonyAudioDevice:
             zone: Zone identifier (default "" for main zone)
         """
         mute_str = "on" if mute else "off"
-        params = [{"output": zone, "mute": mute_str}]
-        await self._call("audio", "setAudioMute", params, "1.1")
+        body = _output_setting_body("setAudioMute", "1.1", zone, "mute", mute_str)
+        await self._call("audio", "setAudioMute", body=body, expect_result=False)
 
     async def get_sound_settings(self, target: str = "", output: str = "") -> list[dict[str, Any]]:
         """
@@ -245,7 +642,7 @@ class SonyAudioDevice:
         params = [{"settings": [{"target": target, "value": value}]}]
         if output:
             params[0]["output"] = output
-        await self._call("audio", "setSoundSettings", params, "1.1")
+        await self._call("audio", "setSoundSettings", params, "1.1", expect_result=False)
 
     async def get_speaker_settings(self, target: str = "") -> list[dict[str, Any]]:
         """
@@ -282,7 +679,7 @@ class SonyAudioDevice:
             - set_speaker_level("surroundLLevel", -0.5)
         """
         params = [{"settings": [{"target": target, "value": str(value)}]}]
-        await self._call("audio", "setSpeakerSettings", params, "1.0")
+        await self._call("audio", "setSpeakerSettings", params, "1.0", expect_result=False)
 
     async def get_equalizer_settings(self, target: str = "") -> list[dict[str, Any]]:
         """
@@ -306,8 +703,7 @@ class SonyAudioDevice:
         Returns:
             List of scheme dictionaries
         """
-        result = await self._call("avContent", "getSchemeList", [], "1.0")
-        return result["result"][0]
+        return await self._call_cached("avContent", "getSchemeList", [], "1.0", ("schemes",))
 
     async def get_source_list(self, scheme: str = "extInput") -> list[dict[str, Any]]:
         """
@@ -319,8 +715,7 @@ class SonyAudioDevice:
         Returns:
             List of source dictionaries with metadata
         """
-        result = await self._call("avContent", "getSourceList", [{"scheme": scheme}], "1.2")
-        return result["result"][0]
+        return await self._call_cached("avContent", "getSourceList", [{"scheme": scheme}], "1.2", ("sources", scheme))
 
     async def get_playing_content_info(self, zone: str = "") -> list[dict[str, Any]]:
         """
@@ -332,11 +727,8 @@ class SonyAudioDevice:
         Returns:
             List of content info dictionaries
         """
-        if zone:
-            params = [{"output": zone}]
-        else:
-            params = [{}]
-        result = await self._call("avContent", "getPlayingContentInfo", params, "1.2")
+        body = _output_query_body("getPlayingContentInfo", "1.2", zone)
+        result = await self._call("avContent", "getPlayingContentInfo", body=body)
         return result["result"][0]
 
     async def switch_input(self, uri: str, zone: str = "") -> None:
@@ -348,7 +740,7 @@ class SonyAudioDevice:
             zone: Zone identifier (default "" for main zone)
         """
         params = [{"output": zone, "uri": uri}]
-        await self._call("avContent", "setPlayContent", params, "1.2")
+        await self._call("avContent", "setPlayContent", params, "1.2", expect_result=False)
 
     async def get_external_terminals_status(self, output: str = "") -> list[dict[str, Any]]:
         """
@@ -360,12 +752,7 @@ class SonyAudioDevice:
         Returns:
             List of terminal status dictionaries
         """
-        result = await self._call(
-            "avContent",
-            "getCurrentExternalTerminalsStatus",
-            [{"output": output}],
-            "1.2"
-        )
+        result = await self._call("avContent", "getCurrentExternalTerminalsStatus", [{"output": output}], "1.2")
         return result["result"][0]
 
     async def set_active_terminal(self, uri: str, active: bool) -> None:
@@ -382,7 +769,9 @@ class SonyAudioDevice:
         """
         status = "active" if active else "inactive"
         params = [{"active": status, "uri": uri}]
-        await self._call("avContent", "setActiveTerminal", params, "1.0")
+        await self._call("avContent", "setActiveTerminal", params, "1.0", expect_result=False)
+        # Terminal changes can change which sources are offered
+        self._invalidate_cache("sources")
 
     async def get_zone_volume(self, zone: int) -> dict[str, Any]:
         """
@@ -394,8 +783,7 @@ class SonyAudioDevice:
         Returns:
             Volume info dict with volume, mute, min/max
         """
-        zone_uri = f"extOutput:zone?zone={zone}"
-        result = await self.get_volume_info(zone_uri)
+        result = await self.get_volume_info(zone_uri(zone))
         return result[0] if result else {}
 
     async def set_zone_volume(self, zone: int, volume: int | str) -> None:
@@ -406,8 +794,7 @@ class SonyAudioDevice:
             zone: Zone number (1=Main, 2=Zone 2, 3=Zone 3)
             volume: Absolute level (0-74) or relative ("+1", "-2")
         """
-        zone_uri = f"extOutput:zone?zone={zone}"
-        await self.set_volume(volume, zone_uri)
+        await self.set_volume(volume, zone_uri(zone))
 
     async def set_zone_mute(self, zone: int, mute: bool) -> None:
         """
@@ -417,8 +804,11 @@ class SonyAudioDevice:
             zone: Zone number (1=Main, 2=Zone 2, 3=Zone 3)
             mute: True for mute on, False for mute off
         """
-        zone_uri = f"extOutput:zone?zone={zone}"
-        await self.set_mute(mute, zone_uri)
+        await self.set_mute(mute, zone_uri(zone))
+
+
+class DeviceUnreachableError(aiohttp.ClientConnectionError):
+    """Raised without contacting a device after repeated failed calls to it."""
 
 
 class SonyApiError(Exception):